@@ -1,15 +1,148 @@
 # Import NLTK for natural language processing
-# NLTK provides the TextTiling algorithm for topic segmentation
+# NLTK provides sentence tokenization and the stopword list used by TextTiling
 import nltk
-from nltk.tokenize import TextTilingTokenizer
+from nltk.corpus import stopwords
+from nltk.tokenize.punkt import PunktTokenizer
+
+# Import re for the precompiled word / paragraph-break patterns
+import re
+
+# Import sys to write the chunking report in one call
+import sys
+
+# Import functools to load the sentence tokenizer only once per process
+import functools
+
+# Import OrderedDict for the bounded per-chunker result cache
+from collections import OrderedDict
+
+# Import itertools to join overlap and chunk words without intermediate strings
+import itertools
+
+# Import ProcessPoolExecutor to chunk several transcripts on separate cores
+from concurrent.futures import ProcessPoolExecutor
+
+# Import hashlib and os for the on-disk chunk_with_metadata cache
+import hashlib
+import os
+
+# Import NumPy, SciPy and scikit-learn for the vectorized TextTiling scoring
+# Block similarities are computed as sparse matrix products instead of Python loops
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.signal import find_peaks
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
 
 # Import typing utilities for type hints
-from typing import List, Dict
+from typing import List, Dict, Optional, Iterator, Tuple
 
 # Import json for saving chunk metadata
 import json
 
 
+# Word tokens used for TextTiling (letters only, like NLTK's TextTilingTokenizer)
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Paragraph breaks inserted by _preprocess_for_texttiling
+_PARA_BREAK_RE = re.compile(r"\n\s*\n")
+
+# Whitespace after a sentence terminator, where _preprocess_for_texttiling may break
+_SENT_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Width of the moving average applied to the gap scores (NLTK default)
+_SMOOTHING_WIDTH = 2
+
+# Number of recent chunk_text results each SemanticChunker keeps
+_CHUNK_CACHE_SIZE = 32
+
+# Boundary selection strategies supported by SemanticChunker
+_SEGMENTATION_METHODS = ("texttiling", "optimal")
+
+# Longest segment the "optimal" method considers, in blocks of k pseudosentences
+_MAX_SEGMENT_BLOCKS = 4
+
+# Hashed feature space for the similarity-based fallback
+_HASH_FEATURES = 2 ** 14
+
+# Default directory for cached chunk_with_metadata results; unset disables the cache
+_DISK_CACHE_DIR = os.getenv("CHUNK_CACHE_DIR") or None
+
+# Most cached results kept in the directory; the least recently written are deleted first
+_DISK_CACHE_MAX_FILES = int(os.getenv("CHUNK_CACHE_MAX_FILES", "256"))
+
+# Part of every cache key; bump whenever the chunking algorithm or the
+# metadata fields change so results cached by older code are never reused
+_CACHE_VERSION = 1
+
+
+def _prune_disk_cache(cache_dir: str, max_files: int = _DISK_CACHE_MAX_FILES):
+    """
+    Delete the oldest cached results so cache_dir holds at most max_files of them.
+    """
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith(".json")]
+        if len(entries) <= max_files:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - max_files]:
+            os.remove(entry.path)
+    except OSError as e:
+        # Another worker may have removed the same file first
+        print(f"Could not prune chunk cache: {str(e)}")
+
+
+def _wc(s: str) -> int:
+    """
+    Count the words in s without building the list that str.split() returns.
+    
+    Chunks are single-space separated, so the fast path is one C-level
+    str.count scan. Anything with other whitespace (newlines, tabs, runs of
+    spaces, leading/trailing spaces) falls back to split() for an exact count.
+    """
+    # isprintable() is False for every whitespace character except ' '
+    if s.isprintable() and '  ' not in s and s[:1] != ' ' and s[-1:] != ' ':
+        return s.count(' ') + 1 if s else 0
+    return len(s.split())
+
+
+# NLTK resources the chunker loads, as (nltk.data path, download name)
+_NLTK_RESOURCES = (
+    ("tokenizers/punkt_tab", "punkt_tab"),
+    ("corpora/stopwords", "stopwords"),
+)
+
+
+def _ensure_punkt():
+    """
+    Make sure the Punkt model and stopword list are installed.
+    
+    Runs once at import so a missing resource is downloaded at startup
+    (build.sh normally installs them) instead of failing the first chunking
+    request.
+    """
+    for path, name in _NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            print(f"Downloading NLTK {name}...")
+            nltk.download(name, quiet=True)
+
+
+_ensure_punkt()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sentence_tokenizer() -> PunktTokenizer:
+    """
+    Load the English Punkt sentence tokenizer once and share it across chunkers.
+    
+    nltk.sent_tokenize looks the model up on every call; keeping the loaded
+    instance avoids that cost on each chunking request.
+    """
+    return PunktTokenizer('english')
+
+
 class SemanticChunker:
     """
     A class to perform semantic chunking on text using the TextTiling algorithm.
@@ -32,7 +165,7 @@ class SemanticChunker:
     RESULT: Chunks that represent coherent topics/segments
     """
     
-    def __init__(self, w=20, k=10):
+    def __init__(self, w=20, k=10, method: str = "texttiling"):
         """
         Initialize the SemanticChunker with TextTiling parameters.
         
@@ -43,17 +176,57 @@ class SemanticChunker:
             k (int): Smoothing parameter (default: 10)
                      - Controls sensitivity to topic changes
                      - Higher k = smoother, fewer boundaries
+            method (str): How boundaries are chosen (default: "texttiling")
+                     - "texttiling": Hearst's depth-score valleys
+                     - "optimal": globally optimal cohesion segmentation (dynamic programming)
         
         WHY THESE DEFAULTS?
         - w=20: Good balance for YouTube transcripts (2-3 minute segments)
         - k=10: Standard smoothing, avoids over-segmentation
         """
-        # Create the TextTiling tokenizer with specified parameters
-        self.tokenizer = TextTilingTokenizer(w=w, k=k)
+        if method not in _SEGMENTATION_METHODS:
+            raise ValueError(f"Unknown segmentation method: {method}")
+        
+        # Load the stopword list once; stopwords are ignored when comparing blocks
+        self.stopwords = frozenset(stopwords.words('english'))
+        
+        # Token-id seed for _texttiling: every stopword maps to the "skip" id -1
+        self._stopword_ids = dict.fromkeys(self.stopwords, -1)
+        
+        # Shared, already-loaded sentence tokenizer
+        self._sent_tokenizer = _get_sentence_tokenizer()
+        
+        # Stateless bag-of-words vectorizer for the similarity-based fallback
+        self._hasher = HashingVectorizer(n_features=_HASH_FEATURES, alternate_sign=False,
+                                         norm='l2', stop_words=list(self.stopwords))
         
         # Store parameters for reference
         self.window_size = w
         self.smoothing = k
+        self.method = method
+        
+        # Recent chunk_text results, keyed by (text, w, k, method), least recently used first
+        self._chunk_cache = OrderedDict()
+    
+    def __getstate__(self) -> Dict:
+        """
+        Pickle only the configuration; worker processes rebuild the rest.
+        
+        The sentence tokenizer is reloaded from the per-process cache and the
+        result cache starts empty, so sending a chunker to a worker stays cheap.
+        """
+        state = self.__dict__.copy()
+        del state['_sent_tokenizer']
+        del state['_chunk_cache']
+        return state
+    
+    def __setstate__(self, state: Dict):
+        """
+        Restore a pickled chunker (see __getstate__).
+        """
+        self.__dict__.update(state)
+        self._sent_tokenizer = _get_sentence_tokenizer()
+        self._chunk_cache = OrderedDict()
     
     def chunk_text(self, text: str) -> List[str]:
         """
@@ -74,6 +247,47 @@ class SemanticChunker:
         if not text or len(text.strip()) == 0:
             return []
         
+        # Reuse the result if this transcript was chunked recently with the same parameters
+        key = (text, self.window_size, self.smoothing, self.method)
+        cached = self._chunk_cache.get(key)
+        if cached is not None:
+            self._chunk_cache.move_to_end(key)
+            return list(cached)
+        
+        chunks = self._chunk_text_uncached(text)
+        
+        self._chunk_cache[key] = tuple(chunks)
+        if len(self._chunk_cache) > _CHUNK_CACHE_SIZE:
+            self._chunk_cache.popitem(last=False)
+        
+        return chunks
+    
+    def chunk_texts(self, texts: List[str], processes: Optional[int] = None) -> List[List[str]]:
+        """
+        Chunk several transcripts in parallel, one worker process per core.
+        
+        Args:
+            texts (List[str]): The input texts to chunk
+            processes (int): Number of worker processes (default: CPU count)
+        
+        Returns:
+            List[List[str]]: The chunk_text result for each text, in input order
+        
+        WHY PROCESSES?
+        - Chunking is CPU-bound Python that holds the GIL
+        - Separate processes let a batch of videos use every core
+        """
+        # A single transcript is not worth the cost of starting a pool
+        if len(texts) <= 1:
+            return [self.chunk_text(text) for text in texts]
+        
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(self.chunk_text, texts, chunksize=4))
+    
+    def _chunk_text_uncached(self, text: str) -> List[str]:
+        """
+        Run TextTiling (or the fallback) on non-empty text; see chunk_text.
+        """
         try:
             # Preprocess text to ensure it has paragraph breaks for TextTiling
             # TextTiling requires \n\n to identify blocks
@@ -81,7 +295,7 @@ class SemanticChunker:
             
             # Use TextTiling to tokenize (chunk) the text
             # This returns a list of text segments
-            chunks = self.tokenizer.tokenize(structured_text)
+            chunks = self._texttiling(structured_text)
             
             # Post-process chunks to remove the artificial newlines if desired
             # (Optional: depends on if we want to keep the structure)
@@ -94,11 +308,247 @@ class SemanticChunker:
         except Exception as e:
             # If TextTiling fails (e.g., text too short), fall back to simple chunking
             print(f"TextTiling failed: {str(e)}")
+            
+            # Long texts are split where word similarity dips; this needs no
+            # sentence punctuation, which auto-generated transcripts often lack
+            chunks = self._hashing_fallback_chunking(text)
+            if chunks:
+                print("Falling back to similarity-based chunking")
+                return chunks
+            
             print("Falling back to simple sentence-based chunking")
             
             # Fallback: Split by sentences and group into reasonable chunks
             return self._fallback_chunking(text)
 
+    def _texttiling(self, text: str) -> List[str]:
+        """
+        Segment text at topic boundaries using a vectorized TextTiling.
+        
+        Follows Hearst's algorithm as implemented by NLTK's TextTilingTokenizer
+        (pseudosentences of w tokens, blocks of k pseudosentences, depth scores
+        with the mean - stdev/2 cutoff, boundaries snapped to paragraph breaks),
+        but scores every gap at once with sparse matrix products.
+        
+        Args:
+            text (str): Text containing paragraph breaks (\\n\\n)
+        
+        Returns:
+            List[str]: Text segments split at the detected topic boundaries
+        
+        Raises:
+            ValueError: If the text has no paragraph breaks or is too short to score
+        """
+        para_breaks = np.array([m.start() for m in _PARA_BREAK_RE.finditer(text)])
+        if len(para_breaks) == 0:
+            raise ValueError("No paragraph breaks were found")
+        
+        # Tokenize once; findall/split run in C, and the pieces between words
+        # give every word's character offset through one cumulative sum
+        lowered = text.lower()
+        words = _WORD_RE.findall(lowered)
+        num_words = len(words)
+        
+        # Pseudosentence x vocabulary token-count matrix (duplicates are summed)
+        num_seqs = -(-num_words // self.window_size)
+        num_gaps = num_seqs - 1
+        if num_gaps < 1:
+            raise ValueError("Text is too short for TextTiling")
+        
+        separators = _WORD_RE.split(lowered)
+        lengths = np.empty(2 * num_words, dtype=np.int64)
+        lengths[0::2] = np.fromiter(map(len, separators[:-1]), dtype=np.int64, count=num_words)
+        lengths[1::2] = np.fromiter(map(len, words), dtype=np.int64, count=num_words)
+        offsets = np.cumsum(lengths)[0::2]
+        
+        # Map every token to a 4-byte column id with a single hash lookup: the
+        # id is the position of the word's first occurrence (ids need not be
+        # contiguous), and stopwords are pre-seeded with -1 so they drop out
+        token_ids = self._stopword_ids.copy()
+        cols = np.fromiter(
+            map(token_ids.setdefault, words, itertools.count()), dtype=np.int32, count=num_words
+        )
+        keep = cols >= 0
+        rows = np.arange(num_words, dtype=np.int32) // self.window_size
+        counts = csr_matrix(
+            (np.ones(np.count_nonzero(keep)), (rows[keep], cols[keep])), shape=(num_seqs, num_words)
+        )
+        
+        if self.method == "optimal":
+            boundary_gaps = self._optimal_boundaries(counts)
+        else:
+            boundary_gaps = self._texttiling_boundaries(counts)
+        
+        # Snap each boundary to the nearest paragraph break
+        boundary_offsets = offsets[(boundary_gaps + 1) * self.window_size]
+        index = np.searchsorted(para_breaks, boundary_offsets)
+        lower = para_breaks[np.maximum(index - 1, 0)]
+        upper = para_breaks[np.minimum(index, len(para_breaks) - 1)]
+        cuts = np.unique(np.where(boundary_offsets - lower <= upper - boundary_offsets, lower, upper))
+        
+        segments = []
+        previous = 0
+        for cut in cuts.tolist() + [len(text)]:
+            if text[previous:cut].strip():
+                segments.append(text[previous:cut])
+            previous = cut
+        return segments
+    
+    def _texttiling_boundaries(self, counts: csr_matrix) -> np.ndarray:
+        """
+        Boundary gaps by Hearst's block comparison and depth scores.
+        
+        Args:
+            counts (csr_matrix): Pseudosentence x vocabulary token counts
+        
+        Returns:
+            np.ndarray: Sorted gap indices (gap i follows pseudosentence i)
+        """
+        num_seqs = counts.shape[0]
+        num_gaps = num_seqs - 1
+        
+        # Block windows around each gap: k pseudosentences per side, shrunk at the edges
+        gaps = np.arange(num_gaps)
+        window = np.minimum(np.minimum(gaps + 1, num_gaps - gaps), self.smoothing)
+        
+        # A right block is the next gaps' left block, so each distinct
+        # (start, width) window is summed and normalized only once
+        starts = np.concatenate([gaps - window + 1, gaps + 1])
+        widths = np.concatenate([window, window])
+        keys, block_of = np.unique(starts * (self.smoothing + 1) + widths, return_inverse=True)
+        block_start, block_width = np.divmod(keys, self.smoothing + 1)
+        block_ids = np.repeat(np.arange(len(keys)), block_width)
+        step = np.arange(len(block_ids)) - np.repeat(np.cumsum(block_width) - block_width, block_width)
+        ones = np.ones(len(block_ids))
+        windows = csr_matrix((ones, (block_ids, np.repeat(block_start, block_width) + step)),
+                             shape=(len(keys), num_seqs))
+        blocks = normalize(windows @ counts, norm='l2', axis=1)
+        
+        # Cosine similarity of every adjacent block pair in one shot
+        left_blocks = blocks[block_of[:num_gaps]]
+        right_blocks = blocks[block_of[num_gaps:]]
+        gap_scores = np.asarray(left_blocks.multiply(right_blocks).sum(axis=1)).ravel()
+        
+        smoothed = self._smooth_scores(gap_scores)
+        depth = self._depth_scores(smoothed)
+        return self._identify_boundaries(depth)
+    
+    def _optimal_boundaries(self, counts: csr_matrix) -> np.ndarray:
+        """
+        Boundary gaps of the globally optimal segmentation (dynamic programming).
+        
+        Each segment scores the sum of its pairwise pseudosentence cosines minus
+        a baseline, the mean cosine between pseudosentences up to k apart. A
+        segment that mixes two topics picks up below-baseline pairs and scores
+        worse than splitting, so no depth cutoff or smoothing is needed. The best
+        score V[n] of the first n pseudosentences is max over l of V[l] + score(l, n),
+        with segments capped at _MAX_SEGMENT_BLOCKS * k pseudosentences.
+        
+        Args:
+            counts (csr_matrix): Pseudosentence x vocabulary token counts
+        
+        Returns:
+            np.ndarray: Sorted gap indices (gap i follows pseudosentence i)
+        """
+        num_seqs = counts.shape[0]
+        max_len = max(_MAX_SEGMENT_BLOCKS * self.smoothing, 1)
+        
+        # Pairwise cosines relative to the local baseline (self-similarity excluded)
+        unit = normalize(counts, norm='l2', axis=1)
+        cohesion = (unit @ unit.T).toarray()
+        nearby = [np.diagonal(cohesion, offset) for offset in range(1, min(self.smoothing, num_seqs - 1) + 1)]
+        cohesion -= np.concatenate(nearby).mean()
+        np.fill_diagonal(cohesion, 0.0)
+        
+        # 2D prefix sums turn any segment's score into four lookups
+        prefix = np.zeros((num_seqs + 1, num_seqs + 1))
+        prefix[1:, 1:] = cohesion.cumsum(axis=0).cumsum(axis=1)
+        
+        best = np.zeros(num_seqs + 1)
+        back = np.zeros(num_seqs + 1, dtype=int)
+        for end in range(1, num_seqs + 1):
+            starts = np.arange(max(0, end - max_len), end)
+            scores = best[starts] + (
+                prefix[end, end] - prefix[starts, end] - prefix[end, starts] + prefix[starts, starts]
+            )
+            choice = int(np.argmax(scores))
+            best[end] = scores[choice]
+            back[end] = starts[choice]
+        
+        # Walk the back pointers; a segment starting at pseudosentence l > 0 means gap l - 1
+        boundaries = []
+        end = back[num_seqs]
+        while end > 0:
+            boundaries.append(end - 1)
+            end = back[end]
+        return np.array(boundaries[::-1], dtype=int)
+    
+    @staticmethod
+    def _smooth_scores(scores: np.ndarray) -> np.ndarray:
+        """
+        Smooth gap scores with a flat moving average (reflected at the edges).
+        
+        Raises:
+            ValueError: If there are fewer scores than the smoothing window
+        """
+        window_len = _SMOOTHING_WIDTH + 1
+        if len(scores) < window_len:
+            raise ValueError("Input vector needs to be bigger than window size.")
+        
+        padded = np.r_[
+            2 * scores[0] - scores[window_len:1:-1],
+            scores,
+            2 * scores[-1] - scores[-1:-window_len:-1],
+        ]
+        smoothed = np.convolve(padded, np.ones(window_len) / window_len, mode='same')
+        return smoothed[window_len - 1:-window_len + 1]
+    
+    @staticmethod
+    def _depth_scores(scores: np.ndarray) -> np.ndarray:
+        """
+        Depth of each gap: how far the score climbs to the nearest peak on each side.
+        
+        The peak reached when climbing left (right) from a gap is the first
+        position where the scores stop rising, found for all gaps at once with
+        running max/min accumulations instead of a per-gap walk.
+        """
+        n = len(scores)
+        positions = np.arange(n)
+        
+        # Left climb stops at t when t == 0 or scores[t - 1] < scores[t]
+        left_stop = np.r_[True, scores[:-1] < scores[1:]]
+        left_peak = scores[np.maximum.accumulate(np.where(left_stop, positions, 0))]
+        
+        # Right climb stops at t when t == n - 1 or scores[t + 1] < scores[t]
+        right_stop = np.r_[scores[1:] < scores[:-1], True]
+        right_index = np.minimum.accumulate(np.where(right_stop, positions, n - 1)[::-1])[::-1]
+        right_peak = scores[right_index]
+        
+        depth = left_peak + right_peak - 2 * scores
+        
+        # Gaps too close to either end are never boundaries
+        clip = min(max(n // 10, 2), 5)
+        depth[:clip] = 0
+        depth[n - clip:] = 0
+        return depth
+    
+    @staticmethod
+    def _identify_boundaries(depth: np.ndarray) -> np.ndarray:
+        """
+        Pick boundary gaps whose depth beats mean - stdev/2, keeping the
+        deepest one when candidates are fewer than 4 gaps apart.
+        """
+        cutoff = depth.mean() - depth.std() / 2.0
+        candidates = np.nonzero(depth > cutoff)[0]
+        
+        # Deepest first (ties broken towards the later gap, as NLTK does);
+        # a gap is kept unless a kept boundary lies within 3 gaps of it
+        taken = np.zeros(len(depth) + 6, dtype=bool)
+        for gap in candidates[np.lexsort((-candidates, -depth[candidates]))].tolist():
+            if not taken[gap:gap + 7].any():
+                taken[gap + 3] = True
+        return np.nonzero(taken)[0] - 3
+
     def _preprocess_for_texttiling(self, text: str, sentences_per_block: int = 5) -> str:
         """
         Preprocess text by inserting paragraph breaks every N sentences.
@@ -111,28 +561,64 @@ class SemanticChunker:
         Returns:
             str: Text with \n\n inserted
         """
-        # Split into sentences
-        sentences = nltk.sent_tokenize(text)
+        # Find every sentence-ending gap in one regex scan (no Punkt pass needed;
+        # TextTiling only needs approximate paragraph markers)
+        text = text.strip()
+        block_ends = list(_SENT_END_RE.finditer(text))[sentences_per_block - 1::sentences_per_block]
         
-        # Group sentences into blocks
+        # Replace every Nth gap with a paragraph break, slicing the text in between
         blocks = []
-        current_block = []
-        
-        for i, sentence in enumerate(sentences):
-            current_block.append(sentence)
-            
-            # If block is full, join and add to blocks
-            if (i + 1) % sentences_per_block == 0:
-                blocks.append(' '.join(current_block))
-                current_block = []
-        
-        # Add remaining sentences
-        if current_block:
-            blocks.append(' '.join(current_block))
+        previous = 0
+        for match in block_ends:
+            blocks.append(text[previous:match.start()])
+            previous = match.end()
+        blocks.append(text[previous:])
             
         # Join blocks with double newline
         return '\n\n'.join(blocks)
     
+    def _hashing_fallback_chunking(self, text: str, min_words: int = 100) -> List[str]:
+        """
+        Similarity-based fallback used when TextTiling fails on a long text.
+        
+        Args:
+            text (str): The input text
+            min_words (int): Minimum words per chunk (default: 100)
+        
+        Returns:
+            List[str]: List of text chunks, or [] if the text is too short to split this way
+        
+        HOW IT WORKS:
+        - Cuts the text into pseudosentences of w words (no sentence tokenizer needed)
+        - Hashes all of them into L2-normalized bag-of-words vectors in one call
+        - Scores each gap by the cosine similarity of its two neighbours
+        - Splits at the similarity valleys, at least min_words apart
+        """
+        words = text.split()
+        w = self.window_size
+        
+        # Need at least two gaps on each side of a chunk to find a valley
+        if len(words) < 2 * max(min_words, 2 * w):
+            return []
+        
+        # Fixed-size pseudosentences, vectorized in a single transform
+        pseudosentences = [' '.join(words[i:i + w]) for i in range(0, len(words), w)]
+        vectors = self._hasher.transform(pseudosentences)
+        
+        # Cosine similarity across every gap (rows are already unit length)
+        sims = np.asarray(vectors[:-1].multiply(vectors[1:]).sum(axis=1)).ravel()
+        
+        # Valleys in similarity are topic shifts; keep them min_words apart
+        min_gap = max(-(-min_words // w), 1)
+        valleys, _ = find_peaks(-sims, distance=min_gap)
+        
+        # Word offset just after each valley gap; drop cuts that leave a short edge chunk
+        cuts = (valleys + 1) * w
+        cuts = cuts[(cuts >= min_words) & (cuts <= len(words) - min_words)]
+        
+        bounds = [0, *cuts.tolist(), len(words)]
+        return [' '.join(words[start:end]) for start, end in zip(bounds, bounds[1:])]
+    
     def _fallback_chunking(self, text: str, target_sentences: int = 15, 
                            min_words: int = 100, max_words: int = 300) -> List[str]:
         """
@@ -154,31 +640,35 @@ class SemanticChunker:
         - Better quality chunks for RAG systems
         """
         # Split text into sentences using basic punctuation
-        sentences = nltk.sent_tokenize(text)
+        sentences = self._sent_tokenizer.tokenize(text)
+        
+        # Count each sentence's words once; chunk sizes are running sums of these
+        sentence_word_counts = [_wc(sentence) for sentence in sentences]
         
         # Group sentences into chunks with size constraints
         chunks = []
-        current_chunk = []
+        start_idx = 0   # First sentence of the current chunk
+        word_count = 0  # Words in sentences[start_idx:i + 1]
         
-        for i, sentence in enumerate(sentences):
+        for i in range(len(sentences)):
             # Add sentence to current chunk
-            current_chunk.append(sentence)
-            chunk_text = ' '.join(current_chunk)
-            word_count = len(chunk_text.split())
+            word_count += sentence_word_counts[i]
             
-            # Save chunk if it meets size requirements or is the last batch
-            if word_count >= min_words and (i == len(sentences) - 1 or word_count >= max_words):
-                chunks.append(chunk_text)
-                current_chunk = []
-            elif (i + 1) % target_sentences == 0 and word_count >= min_words:
-                # Also save if target sentences reached and minimum size met
-                chunks.append(chunk_text)
-                current_chunk = []
+            # Save chunk if it meets size requirements or is the last batch,
+            # or if target sentences reached and minimum size met
+            if word_count >= min_words and (
+                i == len(sentences) - 1
+                or word_count >= max_words
+                or (i + 1) % target_sentences == 0
+            ):
+                chunks.append(' '.join(sentences[start_idx:i + 1]))
+                start_idx = i + 1
+                word_count = 0
         
         # Add remaining sentences as final chunk if large enough
-        if current_chunk:
-            final_chunk = ' '.join(current_chunk)
-            if len(final_chunk.split()) >= min_words or not chunks:
+        if start_idx < len(sentences):
+            final_chunk = ' '.join(sentences[start_idx:])
+            if word_count >= min_words or not chunks:
                 chunks.append(final_chunk)
             elif chunks:
                 # Otherwise merge with last chunk
@@ -210,38 +700,48 @@ class SemanticChunker:
         Without overlap: "...makes predictions." | "ML powers..."
         With overlap:    "...makes predictions. ML powers..." (25 word overlap)
         """
-        # First, get the base chunks from TextTiling
-        base_chunks = self.chunk_text(text)
+        # Only the chunk texts are needed here; word counts are dropped
+        return [chunk for chunk, _, _ in self._iter_chunks(text, overlap_words, use_overlap=True)]
+    
+    def _iter_chunks(self, text: str, overlap_words: int = 25,
+                     use_overlap: bool = True) -> Iterator[Tuple[str, int, bool]]:
+        """
+        Single pipeline behind chunk_with_overlap and chunk_with_metadata.
         
-        if len(base_chunks) <= 1:
-            return base_chunks
+        Args:
+            text (str): The input text to chunk
+            overlap_words (int): Number of words to carry over from the previous chunk
+            use_overlap (bool): Whether to prefix chunks with the previous chunk's tail
+        
+        Yields:
+            Tuple[str, int, bool]: (chunk text, word count, has_overlap)
         
-        # Create overlapped chunks using sliding window
-        overlapped_chunks = []
+        WHY ONE PIPELINE?
+        Each chunk is built with a single join and counted with a single scan,
+        so the metadata path no longer splits a chunk into words, joins it back
+        and splits it again just to count.
+        """
+        # First, get the base chunks from TextTiling
+        previous = None
         
-        for i in range(len(base_chunks)):
-            if i == 0:
-                # First chunk stays as is
-                overlapped_chunks.append(base_chunks[i])
+        for chunk in self.chunk_text(text):
+            if use_overlap and previous is not None:
+                # Last N words of the previous chunk; rsplit only walks the tail of the string
+                tail = previous.rsplit(None, overlap_words)[-overlap_words:]
+                # Combine: previous chunk end + current chunk, in a single join
+                joined = ' '.join(itertools.chain(tail, (chunk,)))
+                yield joined, _wc(joined), True
             else:
-                # For subsequent chunks, prepend the last N words from previous chunk
-                prev_words = base_chunks[i - 1].split()
-                current_words = base_chunks[i].split()
-                
-                # Get overlap from previous chunk (last N words)
-                overlap_text = ' '.join(prev_words[-overlap_words:])
-                
-                # Combine: previous chunk end + current chunk
-                combined = overlap_text + ' ' + base_chunks[i]
-                overlapped_chunks.append(combined.strip())
-        
-        return overlapped_chunks
+                # First chunk (or no overlap) stays as is
+                yield chunk, _wc(chunk), False
+            previous = chunk
     
     def chunk_with_metadata(self, text: str, video_id: str = None, 
                            transcript_segments: List[Dict] = None,
                            video_title: str = "",
                            use_overlap: bool = True, 
-                           overlap_words: int = 25) -> List[Dict]:
+                           overlap_words: int = 25,
+                           cache_dir: Optional[str] = _DISK_CACHE_DIR) -> List[Dict]:
         """
         Chunk text and return chunks with metadata for verification and storage.
         
@@ -253,10 +753,18 @@ class SemanticChunker:
             video_title (str): Title of the video for citation display
             use_overlap (bool): Whether to use overlapping chunks (default: True for RAG)
             overlap_words (int): Number of words to overlap (default: 25)
+            cache_dir (str): Directory for cached results, or None to disable
+                (default: the CHUNK_CACHE_DIR environment variable; disabled if unset)
         
         Returns:
             List[Dict]: List of chunk dictionaries with metadata
         
+        CACHING:
+        Results are saved as JSON under cache_dir, keyed by a hash of the text,
+        the timestamps, every chunking parameter and _CACHE_VERSION. Re-indexing
+        the same transcript with the same settings only reads the file back.
+        At most CHUNK_CACHE_MAX_FILES results are kept.
+        
         METADATA INCLUDES:
         - chunk_id: Sequential ID
         - text: The chunk content
@@ -268,21 +776,80 @@ class SemanticChunker:
         - end_time: End timestamp in seconds (if segments provided)
         - has_overlap: Whether this chunk includes overlap from previous
         """
+        # Reuse a previous run with identical inputs if one is on disk
+        cache_path = None
+        if cache_dir:
+            params = (_CACHE_VERSION, video_id, video_title, self.window_size, self.smoothing,
+                      self.method, use_overlap, overlap_words)
+            key = hashlib.blake2b(json.dumps(params).encode(), digest_size=16)
+            key.update(text.encode())
+            if transcript_segments:
+                key.update(json.dumps(transcript_segments).encode())
+            cache_path = os.path.join(cache_dir, f"{key.hexdigest()}.json")
+            
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        
+        # Create metadata for each chunk
+        chunks_with_metadata = list(self.chunk_with_metadata_iter(
+            text,
+            video_id=video_id,
+            transcript_segments=transcript_segments,
+            video_title=video_title,
+            use_overlap=use_overlap,
+            overlap_words=overlap_words
+        ))
+        
+        # Save for the next run; write then rename so readers never see a partial file
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(chunks_with_metadata, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Could not cache chunks: {str(e)}")
+            else:
+                _prune_disk_cache(cache_dir)
+        
+        return chunks_with_metadata
+    
+    def chunk_with_metadata_iter(self, text: str, video_id: str = None,
+                                 transcript_segments: List[Dict] = None,
+                                 video_title: str = "",
+                                 use_overlap: bool = True,
+                                 overlap_words: int = 25) -> Iterator[Dict]:
+        """
+        Yield the chunk_with_metadata dictionaries one at a time.
+        
+        Args:
+            text (str): The input text to chunk
+            video_id (str): Optional video ID for tracking
+            transcript_segments (List[Dict]): Original transcript segments with timestamps
+            video_title (str): Title of the video for citation display
+            use_overlap (bool): Whether to use overlapping chunks (default: True for RAG)
+            overlap_words (int): Number of words to overlap (default: 25)
+        
+        Yields:
+            Dict: One chunk dictionary (same fields as chunk_with_metadata)
+        
+        Consumers that stream chunks elsewhere (files, batches) never hold the
+        whole list of dictionaries; the disk cache is only used by chunk_with_metadata.
+        """
         # Import timestamp mapper for mapping chunks to timestamps
         from timestamp_mapper import TimestampMapper
         
-        # Get chunks with or without overlap
-        if use_overlap:
-            chunks = self.chunk_with_overlap(text, overlap_words=overlap_words)
-        else:
-            chunks = self.chunk_text(text)
+        # Locate every chunk against one prebuilt transcript index
+        segment_index = TimestampMapper.get_index(transcript_segments) if transcript_segments else None
         
-        # Create metadata for each chunk
-        chunks_with_metadata = []
-        
-        for i, chunk in enumerate(chunks):
+        # Text, word count and overlap flag all come from the shared pipeline
+        chunk_iter = self._iter_chunks(text, overlap_words, use_overlap=use_overlap)
+        for i, (chunk, word_count, has_overlap) in enumerate(chunk_iter):
             # Calculate statistics for this chunk
-            word_count = len(chunk.split())
             char_count = len(chunk)
             
             # Create metadata dictionary
@@ -293,13 +860,13 @@ class SemanticChunker:
                 "char_count": char_count,
                 "video_id": video_id,
                 "video_title": video_title,
-                "has_overlap": (i > 0 and use_overlap)  # Track if chunk includes overlap
+                "has_overlap": has_overlap  # Track if chunk includes overlap
             }
             
             # Add timestamp data if transcript segments are provided
             if transcript_segments:
                 start_time, end_time = TimestampMapper.map_chunk_to_timestamps(
-                    chunk, transcript_segments
+                    chunk, transcript_segments, index=segment_index
                 )
                 chunk_data["start_time"] = start_time
                 chunk_data["end_time"] = end_time
@@ -307,9 +874,65 @@ class SemanticChunker:
                 chunk_data["start_time"] = 0.0
                 chunk_data["end_time"] = 0.0
             
-            chunks_with_metadata.append(chunk_data)
+            yield chunk_data
+    
+    def chunk_with_metadata_columnar(self, text: str, video_id: str = None,
+                                     transcript_segments: List[Dict] = None,
+                                     video_title: str = "",
+                                     use_overlap: bool = True,
+                                     overlap_words: int = 25) -> Dict:
+        """
+        Same metadata as chunk_with_metadata, stored column by column.
         
-        return chunks_with_metadata
+        Args:
+            text (str): The input text to chunk
+            video_id (str): Optional video ID for tracking
+            transcript_segments (List[Dict]): Original transcript segments with timestamps
+            video_title (str): Title of the video for citation display
+            use_overlap (bool): Whether to use overlapping chunks (default: True for RAG)
+            overlap_words (int): Number of words to overlap (default: 25)
+        
+        Returns:
+            Dict: One NumPy array per per-chunk field (chunk_id, text, word_count,
+                  char_count, has_overlap, start_time, end_time), plus the shared
+                  video_id and video_title values
+        
+        WHY COLUMNS?
+        Numeric fields live in packed int32/float32 arrays instead of one Python
+        object per value inside one dict per chunk, so large chunk sets take far
+        less memory and can be summed, filtered or serialized in bulk.
+        """
+        # Import timestamp mapper for mapping chunks to timestamps
+        from timestamp_mapper import TimestampMapper
+        
+        chunks, word_counts, overlaps = [], [], []
+        for chunk, word_count, has_overlap in self._iter_chunks(text, overlap_words, use_overlap=use_overlap):
+            chunks.append(chunk)
+            word_counts.append(word_count)
+            overlaps.append(has_overlap)
+        n = len(chunks)
+        
+        # Timestamps stay zero when no transcript segments are provided
+        start_times = np.zeros(n, dtype=np.float32)
+        end_times = np.zeros(n, dtype=np.float32)
+        if transcript_segments:
+            segment_index = TimestampMapper.get_index(transcript_segments)
+            for i, chunk in enumerate(chunks):
+                start_times[i], end_times[i] = TimestampMapper.map_chunk_to_timestamps(
+                    chunk, transcript_segments, index=segment_index
+                )
+        
+        return {
+            "chunk_id": np.arange(n, dtype=np.int32),
+            "text": np.array(chunks, dtype=object),
+            "word_count": np.array(word_counts, dtype=np.int32),
+            "char_count": np.fromiter(map(len, chunks), dtype=np.int32, count=n),
+            "has_overlap": np.array(overlaps, dtype=bool),
+            "start_time": start_times,
+            "end_time": end_times,
+            "video_id": video_id,
+            "video_title": video_title
+        }
 
     
     def get_chunking_stats(self, chunks: List[str]) -> Dict:
@@ -337,16 +960,18 @@ class SemanticChunker:
             }
         
         # Calculate word counts for each chunk
-        word_counts = [len(chunk.split()) for chunk in chunks]
+        word_counts = np.fromiter(
+            map(_wc, chunks), dtype=np.int32, count=len(chunks)
+        )
         
-        # Calculate statistics
+        # Calculate statistics (vectorized reductions over the counts array)
         stats = {
             "total_chunks": len(chunks),
-            "total_words": sum(word_counts),
-            "avg_words_per_chunk": sum(word_counts) / len(word_counts),
-            "min_words": min(word_counts),
-            "max_words": max(word_counts),
-            "word_counts_per_chunk": word_counts
+            "total_words": int(word_counts.sum()),
+            "avg_words_per_chunk": float(word_counts.mean()),
+            "min_words": int(word_counts.min()),
+            "max_words": int(word_counts.max()),
+            "word_counts_per_chunk": word_counts.tolist()
         }
         
         return stats
@@ -356,13 +981,16 @@ class SemanticChunker:
 # VERIFICATION METHODS
 # ============================================================================
 
-def verify_chunking(original_text: str, chunks: List[str]) -> Dict:
+def verify_chunking(original_text: str, chunks: List[str],
+                    word_counts: Optional[List[int]] = None) -> Dict:
     """
     Verify that chunking was successful and makes sense.
     
     Args:
         original_text (str): The original text before chunking
         chunks (List[str]): The resulting chunks
+        word_counts (List[int]): Optional precomputed word count per chunk
+            (e.g. the "word_count" field from chunk_with_metadata); counted here if omitted
     
     Returns:
         Dict: Verification results
@@ -374,16 +1002,29 @@ def verify_chunking(original_text: str, chunks: List[str]) -> Dict:
     4. Chunks are coherent (basic check)
     """
     # Count words in original text
-    original_word_count = len(original_text.split())
+    original_word_count = _wc(original_text)
+    
+    # Calculate chunk size distribution (one count per chunk, reused below)
+    word_counts = np.fromiter(
+        map(_wc, chunks) if word_counts is None else word_counts,
+        dtype=np.int32, count=len(chunks)
+    )
     
     # Count words in all chunks combined
-    chunks_word_count = sum(len(chunk.split()) for chunk in chunks)
+    chunks_word_count = int(word_counts.sum())
     
-    # Check for empty chunks
-    empty_chunks = sum(1 for chunk in chunks if len(chunk.strip()) == 0)
+    # Check for empty chunks (a chunk with no words is empty or whitespace-only)
+    empty_chunks = int(np.count_nonzero(word_counts == 0))
     
-    # Calculate chunk size distribution
-    word_counts = [len(chunk.split()) for chunk in chunks]
+    # Size stats, reduced once; an empty chunk list has no min/max to take
+    # The average reuses the total above instead of another pass over the counts
+    if len(word_counts):
+        min_size = int(word_counts.min())
+        max_size = int(word_counts.max())
+        avg_size = chunks_word_count / len(word_counts)
+    else:
+        min_size = max_size = 0
+        avg_size = 0
     
     # Verification results
     verification = {
@@ -391,16 +1032,16 @@ def verify_chunking(original_text: str, chunks: List[str]) -> Dict:
         "checks": {
             "no_data_loss": abs(original_word_count - chunks_word_count) < 10,  # Allow small variance
             "no_empty_chunks": empty_chunks == 0,
-            "reasonable_sizes": min(word_counts) > 20 and max(word_counts) < 2000,  # Reasonable range
+            "reasonable_sizes": bool(len(word_counts)) and min_size > 20 and max_size < 2000,  # Reasonable range
             "total_chunks": len(chunks)
         },
         "stats": {
             "original_words": original_word_count,
             "chunks_words": chunks_word_count,
             "empty_chunks": empty_chunks,
-            "min_chunk_size": min(word_counts) if word_counts else 0,
-            "max_chunk_size": max(word_counts) if word_counts else 0,
-            "avg_chunk_size": sum(word_counts) / len(word_counts) if word_counts else 0
+            "min_chunk_size": min_size,
+            "max_chunk_size": max_size,
+            "avg_chunk_size": avg_size
         }
     }
     
@@ -410,56 +1051,55 @@ def verify_chunking(original_text: str, chunks: List[str]) -> Dict:
     return verification
 
 
-def print_chunking_report(chunks: List[str], verification: Dict = None):
+def print_chunking_report(chunks: List[str], verification: Dict = None,
+                          word_counts: Optional[List[int]] = None):
     """
     Print a human-readable report of chunking results.
     
     Args:
         chunks (List[str]): The chunks to report on
         verification (Dict): Optional verification results
+        word_counts (List[int]): Optional precomputed word count per chunk; counted here if omitted
     
     USE THIS TO:
     - Visually inspect chunking quality
     - Debug issues
     - Show results to users
     """
-    print("=" * 80)
-    print("CHUNKING REPORT")
-    print("=" * 80)
+    # Build the whole report in memory first instead of a print per line
+    lines = [
+        "=" * 80,
+        "CHUNKING REPORT",
+        "=" * 80,
+        f"\nTotal Chunks: {len(chunks)}",
+    ]
     
-    print(f"\nTotal Chunks: {len(chunks)}")
+    if word_counts is None:
+        word_counts = map(_wc, chunks)
     
-    for i, chunk in enumerate(chunks):
-        word_count = len(chunk.split())
-        preview = chunk[:100] + "..." if len(chunk) > 100 else chunk
-        
-        print(f"\n--- Chunk {i + 1} ---")
-        print(f"Words: {word_count}")
-        print(f"Preview: {preview}")
+    for i, (chunk, word_count) in enumerate(zip(chunks, word_counts)):
+        preview = chunk if len(chunk) <= 100 else f"{chunk[:100]}..."
+        lines.append(f"\n--- Chunk {i + 1} ---\nWords: {word_count}\nPreview: {preview}")
     
     if verification:
-        print("\n" + "=" * 80)
-        print("VERIFICATION RESULTS")
-        print("=" * 80)
-        print(f"Overall: {'✅ PASSED' if verification['passed'] else '❌ FAILED'}")
-        print(f"\nChecks:")
+        lines.append("\n" + "=" * 80)
+        lines.append("VERIFICATION RESULTS")
+        lines.append("=" * 80)
+        lines.append(f"Overall: {'✅ PASSED' if verification['passed'] else '❌ FAILED'}")
+        lines.append(f"\nChecks:")
         for check, result in verification['checks'].items():
             status = "✅" if result else "❌"
-            print(f"  {status} {check}: {result}")
-        print(f"\nStats:")
+            lines.append(f"  {status} {check}: {result}")
+        lines.append(f"\nStats:")
         for key, value in verification['stats'].items():
-            print(f"  {key}: {value}")
+            lines.append(f"  {key}: {value}")
+    
+    # One write for the whole report (print would add a second write for the newline)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Example usage (for testing purposes)
 if __name__ == "__main__":
-    # Download required NLTK data (run once)
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        print("Downloading NLTK punkt tokenizer...")
-        nltk.download('punkt')
-    
     # Example transcript
     sample_transcript = """
     Today we're going to talk about Python programming. Python is a high-level 
@@ -495,8 +1135,8 @@ if __name__ == "__main__":
     overlapped_chunks = chunker.chunk_with_overlap(sample_transcript, overlap_words=25)
     print(f"Total Overlapped Chunks: {len(overlapped_chunks)}\n")
     for i, chunk in enumerate(overlapped_chunks):
-        word_count = len(chunk.split())
-        preview = chunk[:100] + "..." if len(chunk) > 100 else chunk
+        word_count = _wc(chunk)
+        preview = chunk if len(chunk) <= 100 else f"{chunk[:100]}..."
         overlap_marker = "🔄 [OVERLAP]" if i > 0 else "🆕 [FIRST]"
         print(f"--- Chunk {i + 1} {overlap_marker} ---")
         print(f"Words: {word_count}")
@@ -506,7 +1146,8 @@ if __name__ == "__main__":
     print("=" * 80)
     print("EXAMPLE 3: Chunks with Metadata (For Vector Storage)")
     print("=" * 80)
-    chunks_with_meta = chunker.chunk_with_metadata(
+    # Stream the chunk dictionaries; nothing here needs the full list
+    chunks_with_meta = chunker.chunk_with_metadata_iter(
         sample_transcript, 
         video_id="demo_video_123",
         use_overlap=True,
@@ -515,4 +1156,6 @@ if __name__ == "__main__":
     for chunk_data in chunks_with_meta:
         print(f"Chunk {chunk_data['chunk_id']}: {chunk_data['word_count']} words " +
               f"(Overlap: {chunk_data['has_overlap']})")
-        print(f"  Preview: {chunk_data['text'][:80]}...\n")
+        text = chunk_data['text']
+        preview = text if len(text) <= 80 else f"{text[:80]}..."
+        print(f"  Preview: {preview}\n")
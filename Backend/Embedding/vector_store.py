@@ -1,13 +1,106 @@
 # Import ChromaDB for vector storage
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 
 # Import typing utilities
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 
 # Import uuid for generating unique IDs
 import uuid
 
+# Import functools to open the ChromaDB client only once per process
+import functools
+
+# Import os to read index tuning from the environment
+import os
+
+# Import copy, json, threading and OrderedDict for the in-process search result cache
+import copy
+import json
+import threading
+from collections import OrderedDict
+
+
+# Chunks sent to the embedding model per collection.add call
+BATCH = 64
+
+# Upper bound on the text payload of one batch, in bytes
+MAX_BATCH_BYTES = 4_000_000
+
+# HNSW (approximate nearest neighbour graph) settings for new collections
+# - hnsw:space: l2 distance, ChromaDB's default, so stored distances keep their meaning
+# - hnsw:M / hnsw:construction_ef: graph degree and build-time breadth (ChromaDB defaults)
+# - hnsw:search_ef: candidates explored per query; lower is faster, higher improves recall
+# ChromaDB applies these when a collection is created; existing collections keep theirs
+HNSW_METADATA = {
+    "hnsw:space": "l2",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": int(os.getenv("CHROMA_SEARCH_EF", "10"))
+}
+
+# Number of recent search results kept in memory
+_SEARCH_CACHE_SIZE = 1024
+
+# Recent search results shared by every VectorStore in this process, least recently used first
+# Keyed by (collection name, normalized query, n_results, where filter)
+_search_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+
+# Searches run in worker threads while ingests clear the cache; every access holds this lock
+_search_cache_lock = threading.Lock()
+
+# Bumped on every clear; a search only stores its result if no clear happened while
+# it was querying ChromaDB, so results read before an ingest are never cached after it
+_search_cache_generation = 0
+
+
+def _clear_search_cache():
+    """Drop every cached search result and start a new cache generation."""
+    global _search_cache_generation
+    with _search_cache_lock:
+        _search_cache.clear()
+        _search_cache_generation += 1
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client() -> "chromadb.PersistentClient":
+    """
+    Open the on-disk ChromaDB client once and share it across VectorStores.
+    
+    PersistentClient opens the SQLite store and reads collection metadata on
+    construction; reusing one client keeps that off the per-request path.
+    """
+    return chromadb.PersistentClient(path="chroma_db")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_embedding_function() -> "embedding_functions.DefaultEmbeddingFunction":
+    """
+    Shared all-MiniLM-L6-v2 embedder (ChromaDB's default), loaded once per process.
+    """
+    return embedding_functions.DefaultEmbeddingFunction()
+
+def _batch_bounds(documents: List[str], batch_size: int, max_bytes: int = MAX_BATCH_BYTES) -> Iterator[Tuple[int, int]]:
+    """
+    Split documents into (start, end) batches of at most batch_size items and max_bytes of text.
+    
+    len(text) * 4 bounds a string's UTF-8 size without encoding it. A single
+    document larger than max_bytes still gets a batch of its own.
+    """
+    start = 0
+    running_bytes = 0
+    for i, doc in enumerate(documents):
+        doc_bytes = len(doc) * 4
+        if i > start and (i - start >= batch_size or running_bytes + doc_bytes > max_bytes):
+            yield start, i
+            start = i
+            running_bytes = 0
+        running_bytes += doc_bytes
+    if start < len(documents):
+        yield start, len(documents)
+
+
 class VectorStore:
     """
     A class to handle vector database operations using ChromaDB.
@@ -21,37 +114,50 @@ class VectorStore:
         Args:
             collection_name (str): Name of the collection to store embeddings in
         """
-        # Initialize ChromaDB client
+        # Shared ChromaDB client
         # PersistentClient saves data to disk so it persists between restarts
-        self.client = chromadb.PersistentClient(path="chroma_db")
+        self.client = _get_client()
         
         # Get or create the collection
-        # ChromaDB uses the default embedding function (all-MiniLM-L6-v2) if none is provided
+        # ChromaDB's default embedding function (all-MiniLM-L6-v2), held here so
+        # add_chunks can embed documents itself
         # This model converts text to 384-dimensional vectors
-        self.collection = self.client.get_or_create_collection(name=collection_name)
+        self.embedding_function = _get_embedding_function()
+        # Searches walk an HNSW graph instead of comparing against every stored chunk
+        self.collection = self.client.get_or_create_collection(
+            name=collection_name,
+            embedding_function=self.embedding_function,
+            metadata=HNSW_METADATA
+        )
         
-    def add_chunks(self, chunks_with_metadata: List[Dict]):
+    def add_chunks(self, chunks_with_metadata: List[Dict], batch_size: int = BATCH):
         """
         Add text chunks to the vector database.
         
         Args:
             chunks_with_metadata (List[Dict]): List of chunk dictionaries containing 'text' and metadata
+            batch_size (int): Max chunks embedded per model call (default: 64);
+                batches are also cut at MAX_BATCH_BYTES of text
+        
+        WHY BATCHES?
+        The embedding model runs one forward pass per batch. Fixed-size
+        batches keep each pass near its best throughput, and long videos no
+        longer go through as one huge call. Identical texts are embedded once.
+        The precomputed embeddings are then inserted with as few
+        collection.add calls as ChromaDB allows (usually one per video).
         """
         if not chunks_with_metadata:
             return
             
         # Prepare data for ChromaDB
-        documents = []  # The actual text content
-        metadatas = []  # Metadata (video_id, chunk_id, etc.)
-        ids = []        # Unique IDs for each chunk
+        # Each list is built in one comprehension instead of growing with per-chunk appends
         
-        for chunk in chunks_with_metadata:
-            # Add text
-            documents.append(chunk['text'])
-            
-            # Add metadata (filter out 'text' to avoid duplication)
-            # We convert non-string/int/float values to strings if necessary
-            meta = {
+        # The actual text content
+        documents = [chunk['text'] for chunk in chunks_with_metadata]
+        
+        # Metadata (video_id, chunk_id, etc.), filtering out 'text' to avoid duplication
+        metadatas = [
+            {
                 "video_id": chunk.get('video_id', 'unknown'),
                 "chunk_id": chunk.get('chunk_id', 0),
                 "word_count": chunk.get('word_count', 0),
@@ -59,25 +165,60 @@ class VectorStore:
                 "end_time": chunk.get('end_time', 0.0),      # NEW: For timestamp attribution
                 "video_title": chunk.get('video_title', '')  # NEW: For citation display
             }
-            metadatas.append(meta)
-            
-            # Generate a unique ID for the chunk
-            # Format: video_id_chunk_id
-            unique_id = f"{chunk.get('video_id', 'unknown')}_{chunk.get('chunk_id', 0)}"
-            ids.append(unique_id)
-
-            
-        # Add to collection
-        # ChromaDB automatically handles tokenization and embedding generation
-        self.collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+            for chunk in chunks_with_metadata
+        ]
+        
+        # Unique IDs for each chunk, reusing the metadata values above
+        # Format: video_id_chunk_id
+        # One video per call is the common case, so its prefix is formatted once
+        video_id = metadatas[0]['video_id']
+        if all(meta['video_id'] == video_id for meta in metadatas):
+            prefix = f"{video_id}_"
+            ids = [prefix + str(meta['chunk_id']) for meta in metadatas]
+        else:
+            ids = [f"{meta['video_id']}_{meta['chunk_id']}" for meta in metadatas]
+        
+        # Embed each distinct text once; repeated boilerplate (intros, outros,
+        # "subscribe" callouts) reuses the first copy's embedding
+        unique_index: Dict[str, int] = {}
+        doc_index = [unique_index.setdefault(doc, len(unique_index)) for doc in documents]
+        unique_docs = list(unique_index)
+        unique_embeddings = []
+        for start, end in _batch_bounds(unique_docs, batch_size):
+            unique_embeddings.extend(self.embedding_function(unique_docs[start:end]))
+        embeddings = [unique_embeddings[i] for i in doc_index]
+        
+        # Add to collection in as few calls as possible: each call is one
+        # SQLite transaction and one index update, so only ChromaDB's own
+        # per-call limit and the payload size split the insert
+        max_add = getattr(self.client, "get_max_batch_size", lambda: len(documents))()
+        for start, end in _batch_bounds(documents, max_add):
+            self.collection.add(
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+                ids=ids[start:end]
+            )
+        
+        # Cached results predate the new chunks
+        _clear_search_cache()
         
         print(f"Added {len(documents)} chunks to vector store.")
         
-    def search(self, query: str, n_results: int = 3, video_id: Optional[str] = None) -> List[Dict]:
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query with the same model used for the stored chunks.
+        
+        Args:
+            query (str): The search query (question)
+            
+        Returns:
+            List[float]: 384-dimensional query embedding
+        """
+        return self.embedding_function([query])[0]
+    
+    def search(self, query: str, n_results: int = 3, video_id: Optional[str] = None,
+               query_embedding: Optional[List[float]] = None) -> List[Dict]:
         """
         Search for relevant chunks based on a query.
         
@@ -85,6 +226,8 @@ class VectorStore:
             query (str): The search query (question)
             n_results (int): Number of results to return
             video_id (str): Optional filter to search only within a specific video
+            query_embedding (List[float]): Optional precomputed embed_query(query),
+                so a caller that already embedded the question does not pay twice
             
         Returns:
             List[Dict]: List of relevant chunks with their metadata and distance scores
@@ -92,12 +235,55 @@ class VectorStore:
         # Prepare filter if video_id is provided
         where_filter = {"video_id": video_id} if video_id else None
         
-        # Perform search
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
+        return self._query(query, n_results, where_filter, query_embedding)
+    
+    def _query(self, query: str, n_results: int, where_filter: Optional[Dict],
+               query_embedding: Optional[List[float]] = None) -> List[Dict]:
+        """
+        Run a search, reusing a cached result for a repeated question.
+        
+        Args:
+            query (str): The search query (question)
+            n_results (int): Number of results to return
+            where_filter (Dict): Optional ChromaDB metadata filter
+            query_embedding (List[float]): Optional precomputed query embedding
+            
+        Returns:
+            List[Dict]: List of relevant chunks with their metadata and distance scores
+        
+        WHY CACHE?
+        Users re-ask questions and the UI re-fetches, and every search embeds the
+        query before the nearest-neighbour lookup. Repeats are answered from
+        memory; copies are returned so callers cannot alter the cached entry.
+        """
+        key = (
+            self.collection.name,
+            query.strip().lower(),
+            n_results,
+            json.dumps(where_filter, sort_keys=True)
         )
+        with _search_cache_lock:
+            cached = _search_cache.get(key)
+            if cached is not None:
+                _search_cache.move_to_end(key)
+            generation = _search_cache_generation
+        if cached is not None:
+            # Cached lists are never modified in place, so copying outside the lock is safe
+            return copy.deepcopy(cached)
+        
+        # Perform search (embedding the query here unless the caller already did)
+        if query_embedding is not None:
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where_filter
+            )
+        else:
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                where=where_filter
+            )
         
         # Format results
         # ChromaDB returns lists of lists (one list per query)
@@ -111,6 +297,17 @@ class VectorStore:
                     "id": results['ids'][0][i],
                     "distance": results['distances'][0][i] if results['distances'] else None
                 })
+        
+        # Remember the result, evicting the least recently used one when full
+        # (skipped if chunks were added or deleted while this search ran)
+        snapshot = copy.deepcopy(formatted_results)
+        with _search_cache_lock:
+            if generation != _search_cache_generation:
+                return formatted_results
+            _search_cache[key] = snapshot
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > _SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
                 
         return formatted_results
     
@@ -125,6 +322,9 @@ class VectorStore:
         self.collection.delete(
             where={"video_id": video_id}
         )
+        
+        # Cached results may point at the deleted chunks
+        _clear_search_cache()
     
     def search_multi_video(
         self, 
@@ -150,26 +350,7 @@ class VectorStore:
             # ChromaDB uses $in operator for multiple values
             where_filter = {"video_id": {"$in": video_ids}}
         
-        # Perform search
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
-        )
-        
-        # Format results
-        formatted_results = []
-        
-        if results['documents']:
-            for i in range(len(results['documents'][0])):
-                formatted_results.append({
-                    "text": results['documents'][0][i],
-                    "metadata": results['metadatas'][0][i],
-                    "id": results['ids'][0][i],
-                    "distance": results['distances'][0][i] if results['distances'] else None
-                })
-                
-        return formatted_results
+        return self._query(query, n_results, where_filter)
 
 
 # Example usage
@@ -1,11 +1,67 @@
 import google.generativeai as genai
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Final, Iterator
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+
+# Static instructions appended to every prompt; built once at import
+_INSTRUCTIONS: Final[str] = """INSTRUCTIONS:
+- Prioritize the video transcript when answering the question.
+- If the transcript directly contains the answer, base your response on it.
+- If the transcript is incomplete, unclear, or assumes prior knowledge, you MAY use your general knowledge to:
+  • Explain concepts
+  • Provide definitions
+  • Clarify terminology
+  • Add brief contextual understanding
+- Do NOT contradict the transcript.
+- Do NOT invent facts that are unrelated to the video topic.
+- If neither the transcript nor your general knowledge reasonably supports an answer, respond with:
+  "I couldn't find a reliable answer based on the video transcript."
+
+STYLE GUIDELINES:
+- Be concise, clear, and direct.
+- Do NOT mention transcript chunks, timestamps, or internal references.
+- Ignore non-informational content such as:
+  • Greetings and introductions
+  • Outros, sign-offs, and calls to action
+  • Casual or irrelevant chatter
+- Focus on the educational and informational content.
+- Maintain continuity using the previous conversation if the question refers back to it.
+        ANSWER:
+        """
+
+
+class GenerationError(Exception):
+    """Raised by generate_answer_stream when Gemini fails to produce the answer."""
+
+
+def _format_history(chat_history: Optional[List[Dict]]) -> str:
+    """
+    Render previous messages for the prompt, or "" when there are none.
+    
+    Args:
+        chat_history (List[Dict]): List of previous messages [{"role": "user", "content": "..."}, ...]
+    
+    Returns:
+        str: "PREVIOUS CONVERSATION:" block followed by a blank line, or ""
+    """
+    if not chat_history:
+        return ""
+    try:
+        # Well-formed messages: one lookup per field
+        lines = [f"{msg['role'].upper()}: {msg['content']}" for msg in chat_history]
+    except KeyError:
+        # Some message lacks a field; fill in the defaults
+        lines = [
+            f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}"
+            for msg in chat_history
+        ]
+    return "PREVIOUS CONVERSATION:\n" + "\n".join(lines) + "\n\n"
+
+
 class GeminiAgent:
     """
     A class to interact with Google's Gemini Pro model for Question Answering.
@@ -23,33 +79,31 @@ class GeminiAgent:
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
         
-    def generate_answer(self, question: str, context_chunks: List[Dict], chat_history: List[Dict] = []) -> str:
+    @staticmethod
+    def _build_prompt(question: str, context_chunks: List[Dict],
+                      chat_history: Optional[List[Dict]] = None) -> str:
         """
-        Generate an answer to the question based on the provided context chunks and chat history.
+        Build the question-answering prompt shared by generate_answer and generate_answer_stream.
         
         Args:
             question (str): The user's question
             context_chunks (List[Dict]): List of relevant transcript chunks from VectorStore
-            chat_history (List[Dict]): List of previous messages [{"role": "user", "content": "..."}, ...]
+            chat_history (List[Dict]): Optional list of previous messages [{"role": "user", "content": "..."}, ...]
             
         Returns:
-            str: The generated answer
+            str: The full prompt
         """
         # 1. Prepare the context text
-        context_text = "\n\n".join([
-            f"Chunk {i+1}: {chunk['text']}" 
-            for i, chunk in enumerate(context_chunks)
-        ])
+        context_text = "\n\n".join(
+            f"Chunk {i}: {chunk['text']}" 
+            for i, chunk in enumerate(context_chunks, start=1)
+        )
         
-        # 2. Format chat history
-        history_text = ""
-        if chat_history:
-            history_text = "PREVIOUS CONVERSATION:\n" + "\n".join([
-                f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}" 
-                for msg in chat_history
-            ]) + "\n\n"
+        # 2. Format chat history (skipped entirely on the first turn)
+        history_text = _format_history(chat_history)
         
         # 3. Construct the prompt
+        # Only the short head is formatted per call; the instructions are a shared constant
         prompt = f"""
         You are an AI assistant that answers questions about YouTube videos based on their transcripts.
         
@@ -60,37 +114,61 @@ class GeminiAgent:
         USER QUESTION:
         {question}
         
-        INSTRUCTIONS:
-- Prioritize the video transcript when answering the question.
-- If the transcript directly contains the answer, base your response on it.
-- If the transcript is incomplete, unclear, or assumes prior knowledge, you MAY use your general knowledge to:
-  • Explain concepts
-  • Provide definitions
-  • Clarify terminology
-  • Add brief contextual understanding
-- Do NOT contradict the transcript.
-- Do NOT invent facts that are unrelated to the video topic.
-- If neither the transcript nor your general knowledge reasonably supports an answer, respond with:
-  "I couldn't find a reliable answer based on the video transcript."
-
-STYLE GUIDELINES:
-- Be concise, clear, and direct.
-- Do NOT mention transcript chunks, timestamps, or internal references.
-- Ignore non-informational content such as:
-  • Greetings and introductions
-  • Outros, sign-offs, and calls to action
-  • Casual or irrelevant chatter
-- Focus on the educational and informational content.
-- Maintain continuity using the previous conversation if the question refers back to it.
-        ANSWER:
+        {_INSTRUCTIONS}"""
+        return prompt
+    
+    def generate_answer(self, question: str, context_chunks: List[Dict],
+                        chat_history: Optional[List[Dict]] = None) -> str:
         """
+        Generate an answer to the question based on the provided context chunks and chat history.
+        
+        Args:
+            question (str): The user's question
+            context_chunks (List[Dict]): List of relevant transcript chunks from VectorStore
+            chat_history (List[Dict]): Optional list of previous messages [{"role": "user", "content": "..."}, ...]
+            
+        Returns:
+            str: The generated answer
+        """
+        prompt = self._build_prompt(question, context_chunks, chat_history)
         
         try:
-            # 3. Generate response
+            # Generate response
             response = self.model.generate_content(prompt)
             return response.text
         except Exception as e:
             return f"Error generating answer: {str(e)}"
+    
+    def generate_answer_stream(self, question: str, context_chunks: List[Dict],
+                               chat_history: Optional[List[Dict]] = None) -> Iterator[str]:
+        """
+        Generate the same answer as generate_answer, yielding text as Gemini produces it.
+        
+        Args:
+            question (str): The user's question
+            context_chunks (List[Dict]): List of relevant transcript chunks from VectorStore
+            chat_history (List[Dict]): Optional list of previous messages [{"role": "user", "content": "..."}, ...]
+            
+        Yields:
+            str: Consecutive pieces of the answer
+        
+        Raises:
+            GenerationError: If Gemini fails, possibly after some pieces were yielded
+        
+        WHY STREAM?
+        A full answer takes seconds to generate, but the first words arrive
+        in a fraction of that. Streaming lets the UI show them right away.
+        """
+        prompt = self._build_prompt(question, context_chunks, chat_history)
+        
+        try:
+            for chunk in self.model.generate_content(prompt, stream=True):
+                # The closing chunk can carry only a finish reason and no text
+                if chunk.parts:
+                    yield chunk.text
+        except Exception as e:
+            # Raised rather than yielded, so an error can never pass for part of the answer
+            raise GenerationError(f"Error generating answer: {str(e)}") from e
 
 # Example usage
 if __name__ == "__main__":
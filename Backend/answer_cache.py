@@ -0,0 +1,145 @@
+"""
+Semantic Answer Cache Module
+
+Reuses answers for questions that mean the same thing as one already asked.
+Questions are compared by the cosine similarity of their embeddings, so
+paraphrases ("what is a list?" / "what's a list") skip the LLM call entirely.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+# Fixed int8 scale for unit vector components in [-1, 1]
+_INT8_SCALE = 127.0
+
+
+class SemanticAnswerCache:
+    """
+    In-process cache of answers keyed by (scope, question embedding).
+
+    A scope is whatever the answer depends on besides the question, e.g.
+    (video_id, n_results). Each scope keeps its question embeddings as one
+    int8 matrix, so a lookup is a single matrix-vector product.
+
+    Entries expire after ttl_seconds; a scope holds at most max_entries
+    answers, dropping the oldest first.
+    """
+
+    def __init__(self, threshold: float = 0.92, ttl_seconds: float = 24 * 60 * 60,
+                 max_entries: int = 256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            threshold (float): Minimum cosine similarity to reuse an answer (default: 0.92)
+            ttl_seconds (float): How long an answer stays valid (default: 24 hours)
+            max_entries (int): Maximum cached answers per scope (default: 256)
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # scope -> {"vectors": int8 unit embeddings (n x d), "answers": [...], "times": [...]}
+        self._scopes: Dict[Hashable, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(embedding: List[float]) -> np.ndarray:
+        """Return the embedding as a float32 unit vector (cosine = dot product)."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    @staticmethod
+    def _quantize(unit: np.ndarray) -> np.ndarray:
+        """
+        Store a unit vector as int8 codes (component * 127).
+        
+        Unit vector components lie in [-1, 1], so one fixed scale fits every
+        vector and needs no per-vector metadata. Codes take a quarter of the
+        float32 memory; comparing them against a float32 query changes cosine
+        scores by well under 0.01.
+        """
+        return np.rint(unit * _INT8_SCALE).astype(np.int8)
+
+    def lookup(self, scope: Hashable, embedding: List[float]) -> Optional[Any]:
+        """
+        Find a cached answer for a question close enough to this one.
+
+        Args:
+            scope (Hashable): What the answer depends on besides the question
+            embedding (List[float]): Embedding of the new question
+
+        Returns:
+            Optional[Any]: The cached answer, or None on a miss
+        """
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                return None
+
+            self._expire(scope, entry)
+            if not entry["answers"]:
+                return None
+
+            # float32 query against int8 codes, rescaled back to cosine similarity
+            similarities = (entry["vectors"] @ self._unit(embedding)) / _INT8_SCALE
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            return entry["answers"][best]
+
+    def store(self, scope: Hashable, embedding: List[float], answer: Any):
+        """
+        Cache an answer for a question.
+
+        Args:
+            scope (Hashable): What the answer depends on besides the question
+            embedding (List[float]): Embedding of the question
+            answer (Any): The answer to return for similar questions
+        """
+        vector = self._quantize(self._unit(embedding))[np.newaxis, :]
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                self._scopes[scope] = {"vectors": vector, "answers": [answer], "times": [time.monotonic()]}
+                return
+
+            # Append, then drop the oldest answers beyond max_entries
+            keep = slice(-self.max_entries, None)
+            entry["vectors"] = np.vstack([entry["vectors"], vector])[keep]
+            entry["answers"] = (entry["answers"] + [answer])[keep]
+            entry["times"] = (entry["times"] + [time.monotonic()])[keep]
+
+    def invalidate(self, video_id: Optional[str]):
+        """
+        Forget every answer that may depend on a video's transcript.
+
+        Scopes are matched on their first element (the video_id); scopes for
+        searches across all videos (video_id None) are dropped as well.
+
+        Args:
+            video_id (str): The video whose transcript changed
+        """
+        with self._lock:
+            for scope in list(self._scopes):
+                scope_video = scope[0] if isinstance(scope, tuple) else scope
+                if scope_video is None or scope_video == video_id:
+                    del self._scopes[scope]
+
+    def _expire(self, scope: Hashable, entry: Dict[str, Any]):
+        """Drop answers older than ttl_seconds (entries are kept oldest first)."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        times = entry["times"]
+        stale = bisect.bisect_left(times, cutoff)
+        if stale:
+            entry["vectors"] = entry["vectors"][stale:]
+            entry["answers"] = entry["answers"][stale:]
+            entry["times"] = times[stale:]
+        if not entry["answers"]:
+            del self._scopes[scope]
@@ -7,7 +7,7 @@ pip install --upgrade pip
 pip install -r requirements.txt
 
 # Download NLTK data (required for semantic chunking)
-python -c "import nltk; nltk.download('punkt'); nltk.download('stopwords')"
+python -c "import nltk; nltk.download('punkt'); nltk.download('punkt_tab'); nltk.download('stopwords')"
 
 # Create necessary directories
 mkdir -p transcripts chunks chroma_db
@@ -1,15 +1,51 @@
 # Enhanced Ask Endpoint with Citations and Timestamps
 # This file contains the enhanced /ask endpoint that provides timestamp attribution
 
-from fastapi import APIRouter
+# Import asyncio to run the blocking search and Gemini calls off the event loop
+import asyncio
+
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from typing import List, Dict, Optional
-from Embedding.vector_store import VectorStore
-from LLM.gemini_agent import GeminiAgent
+from typing import List, Dict, Optional, TYPE_CHECKING
 from timestamp_mapper import TimestampMapper
 
+# VectorStore (chromadb + embedding model) and GeminiAgent (Google SDK) are
+# slow to import, so they are imported on first use; these are for type hints only
+if TYPE_CHECKING:
+    from Embedding.vector_store import VectorStore
+    from LLM.gemini_agent import GeminiAgent
+
 router = APIRouter()
 
+# Shared clients, created on first use and reused by every request
+# Opening the ChromaDB client and configuring the Gemini SDK per request is wasted work
+_vector_store: Optional["VectorStore"] = None
+_gemini_agent: Optional["GeminiAgent"] = None
+
+
+def get_vector_store() -> "VectorStore":
+    """Return the shared VectorStore, creating it (and importing chromadb) on first use."""
+    global _vector_store
+    if _vector_store is None:
+        from Embedding.vector_store import VectorStore
+        _vector_store = VectorStore()
+    return _vector_store
+
+
+def get_gemini_agent() -> "GeminiAgent":
+    """
+    Return the shared GeminiAgent, creating it (and importing the Gemini SDK) on first use.
+    
+    Raises ValueError (and caches nothing) while GOOGLE_API_KEY is missing,
+    so the agent is created as soon as the key is configured.
+    """
+    global _gemini_agent
+    if _gemini_agent is None:
+        from LLM.gemini_agent import GeminiAgent
+        _gemini_agent = GeminiAgent()
+    return _gemini_agent
+
+
 # Define models locally to avoid circular import
 class QuestionRequest(BaseModel):
     """Data model for the question request body."""
@@ -42,33 +78,66 @@ class EnhancedAnswerResponse(BaseModel):
 
 
 
+def _build_citation(metadata: Dict, text: str, distance: float,
+                    start_time: float, end_time: float, formatted: str) -> Citation:
+    """
+    Build a Citation from one search result without re-validating it.
+    
+    Args:
+        metadata (Dict): Chunk metadata stored in the vector store
+        text (str): Chunk text
+        distance (float): Search distance (lower is more relevant)
+        start_time (float): Chunk start in seconds
+        end_time (float): Chunk end in seconds
+        formatted (str): Display range, e.g. "02:14 – 03:05"
+    
+    Returns:
+        Citation: Citation with the text truncated to 200 characters for display
+    """
+    return Citation.model_construct(
+        video_id=metadata.get('video_id', 'unknown'),
+        video_title=metadata.get('video_title', 'Unknown Video'),
+        text=text[:200] + "..." if len(text) > 200 else text,  # Truncate for display
+        timestamp_range=TimestampRange.model_construct(
+            start=start_time,
+            end=end_time,
+            formatted=formatted
+        ),
+        relevance_score=1.0 - distance  # Convert distance to relevance
+    )
+
+
 @router.post("/ask/enhanced", response_model=EnhancedAnswerResponse)
-async def ask_with_citations(request: QuestionRequest):
+async def ask_with_citations(request: QuestionRequest,
+                             vector_store: "VectorStore" = Depends(get_vector_store)):
     """
     Answer a user's question with full citations and timestamp attribution.
     Supports multi-video querying when video_id is None.
     
     Args:
         request: QuestionRequest containing the question and optional video_id
+        vector_store: Shared VectorStore (injected)
     
     Returns:
         EnhancedAnswerResponse with answer, citations, and timestamps
     """
     try:
-        # 1. Initialize Vector Store
-        vector_store = VectorStore()
+        # 1. Vector Store is the shared instance injected above
         
         # 2. Search for relevant chunks (multi-video if video_id is None)
+        # Embedding the query and searching block, so they run in a worker thread
         if request.video_id:
             # Single video search
-            relevant_chunks = vector_store.search(
+            relevant_chunks = await asyncio.to_thread(
+                vector_store.search,
                 query=request.question,
                 n_results=request.n_results,
                 video_id=request.video_id
             )
         else:
             # Multi-video search across all videos
-            relevant_chunks = vector_store.search_multi_video(
+            relevant_chunks = await asyncio.to_thread(
+                vector_store.search_multi_video,
                 query=request.question,
                 n_results=request.n_results
             )
@@ -81,38 +150,30 @@ async def ask_with_citations(request: QuestionRequest):
         
         # 3. Generate Answer using Gemini
         try:
-            agent = GeminiAgent()
-            answer = agent.generate_answer(
+            agent = get_gemini_agent()
+            # The Gemini round-trip also runs in a worker thread
+            answer = await asyncio.to_thread(
+                agent.generate_answer,
                 request.question, 
                 relevant_chunks, 
                 request.chat_history
             )
             
-            # 4. Build citations with timestamps
-            citations = []
-            for chunk in relevant_chunks:
-                metadata = chunk.get('metadata', {})
-                
-                # Get timestamp data from metadata
-                start_time = metadata.get('start_time', 0.0)
-                end_time = metadata.get('end_time', 0.0)
-                
-                # Create timestamp range
-                timestamp_range = TimestampRange(
-                    start=start_time,
-                    end=end_time,
-                    formatted=TimestampMapper.format_range(start_time, end_time)
-                )
-                
-                # Create citation
-                citation = Citation(
-                    video_id=metadata.get('video_id', 'unknown'),
-                    video_title=metadata.get('video_title', 'Unknown Video'),
-                    text=chunk.get('text', '')[:200] + "...",  # Truncate for display
-                    timestamp_range=timestamp_range,
-                    relevance_score=1.0 - chunk.get('distance', 0.0)  # Convert distance to relevance
-                )
-                citations.append(citation)
+            # 4. Build citations with timestamps in one pass
+            # The data comes from our own vector store, so pydantic validation is skipped
+            metadatas = [chunk.get('metadata') or {} for chunk in relevant_chunks]
+            
+            # Get timestamp data from metadata and format every range in one call
+            starts = [metadata.get('start_time', 0.0) for metadata in metadatas]
+            ends = [metadata.get('end_time', 0.0) for metadata in metadatas]
+            formatted = TimestampMapper.format_ranges(starts, ends)
+            
+            citations = [
+                _build_citation(metadata, chunk.get('text', ''), chunk.get('distance', 0.0),
+                                start_time, end_time, formatted_range)
+                for chunk, metadata, start_time, end_time, formatted_range
+                in zip(relevant_chunks, metadatas, starts, ends, formatted)
+            ]
             
             return EnhancedAnswerResponse(
                 success=True,
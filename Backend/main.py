@@ -4,6 +4,10 @@ from fastapi import FastAPI
 # Import CORS middleware to allow cross-origin requests from frontend
 from fastapi.middleware.cors import CORSMiddleware
 
+# Import StreamingResponse and a helper to pull blocking iterators from a worker thread
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
+
 # Import Pydantic BaseModel for request/response validation
 from pydantic import BaseModel
 
@@ -16,21 +20,24 @@ from youtube_transcript import YouTubeTranscriptFetcher
 # Import the text cleaner module
 from textcleaning.Textoptimization import TranscriptCleaner
 
-# Import the semantic chunker module
-from Chunking.Textchunk import SemanticChunker
+# Import the shared vector store and Gemini agent (created once, reused by every request)
+from enhanced_ask import get_vector_store, get_gemini_agent
 
-# Import the vector store module
-from Embedding.vector_store import VectorStore
+# Import the semantic answer cache for repeated / paraphrased questions
+from answer_cache import SemanticAnswerCache
 
-# Import the Gemini Agent
-from LLM.gemini_agent import GeminiAgent
+# Import the LRU-bounded transcript store
+from transcript_store import TranscriptStore
 
 # Import os and pathlib for file operations
 import os
 from pathlib import Path
 
-# Import json for storing chunk metadata
-import json
+# Import orjson for fast serialization of chunk files and metadata
+import orjson
+
+# Import asyncio to run blocking work (network, disk, models) off the event loop
+import asyncio
 
 # Import dotenv to load environment variables
 from dotenv import load_dotenv
@@ -94,34 +101,63 @@ app.add_middleware(
 # ... imports ...
 from database import models, database, schemas 
 import auth
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-# Create tables
-models.Base.metadata.create_all(bind=database.engine)
-
 # ... app definition ...
 app = FastAPI()
 
+# Create tables
+# The engine is async, so table creation runs once the event loop is up
+@app.on_event("startup")
+async def create_tables():
+    async with database.engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+
+# Fill the connection pool before traffic arrives
+@app.on_event("startup")
+async def warm_up_database():
+    await database.warm_up_pool()
+
+# Open the vector store and configure Gemini in the background after startup
+# The server accepts requests (e.g. auth) right away instead of waiting on the heavy imports
+def _create_shared_clients():
+    try:
+        get_vector_store()
+        get_gemini_agent()
+    except Exception as e:
+        # Anything not created here is created on first use instead
+        # (e.g. the Gemini agent, once GOOGLE_API_KEY is set)
+        print(f"Shared clients not initialized: {e}")
+
+@app.on_event("startup")
+async def create_shared_clients():
+    app.state.client_warmup = asyncio.create_task(asyncio.to_thread(_create_shared_clients))
+
 # Auth Routes
 @app.post("/auth/signup", response_model=schemas.UserResponse)
-def signup(user: schemas.UserCreate, db: Session = Depends(database.get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+async def signup(user: schemas.UserCreate, db: AsyncSession = Depends(database.get_db)):
+    result = await db.execute(select(models.User).where(models.User.email == user.email))
+    db_user = result.scalars().first()
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = auth.get_password_hash(user.password)
+    # bcrypt is deliberately slow; hash in a worker thread so other requests keep running
+    hashed_password = await asyncio.to_thread(auth.get_password_hash, user.password)
     db_user = models.User(email=user.email, full_name=user.full_name, hashed_password=hashed_password)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 @app.post("/auth/login", response_model=schemas.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(database.get_db)):
-    user = db.query(models.User).filter(models.User.email == form_data.username).first()
-    if not user or not auth.verify_password(form_data.password, user.hashed_password):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(database.get_db)):
+    result = await db.execute(select(models.User).where(models.User.email == form_data.username))
+    user = result.scalars().first()
+    # Verify in a worker thread for the same reason as hashing in signup
+    if not user or not await asyncio.to_thread(auth.verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -139,10 +175,15 @@ from enhanced_ask import router as enhanced_router
 app.include_router(enhanced_router)
 
 
-# Dictionary to store transcripts with timestamp data in memory
-# Format: {video_id: {"text": "...", "segments": [...], "title": "..."}}
+# Store for transcripts with timestamp data in memory
+# Format: {video_id: {"text": "...", "segments": [...], "title": "...", "word_count": 0, "segment_count": 0}}
+# Bounded to the TRANSCRIPT_CACHE_SIZE most recently used videos (default 128)
 # In production, you would use a database instead
-transcript_storage: Dict[str, Dict] = {}
+transcript_storage = TranscriptStore(maxsize=int(os.getenv("TRANSCRIPT_CACHE_SIZE", "128")))
+
+# Answers to recent questions, reused when a new question is a close paraphrase
+# Scoped by (video_id, n_results); cleared for a video when its transcript is re-processed
+answer_cache = SemanticAnswerCache(threshold=0.92)
 
 
 # Define a Pydantic model for the POST request
@@ -211,8 +252,115 @@ class EnhancedAnswerResponse(BaseModel):
     error: Optional[str] = None
 
 
+# ===== INGEST HELPERS =====
+# Each step blocks (disk, CPU-heavy chunking, embedding), so post_transcript
+# runs them with asyncio.to_thread and other requests keep being served
+
+def _save_transcript(video_id: str, cleaned_transcript: str):
+    """
+    Write the cleaned transcript to transcripts/<video_id>.txt.
+    """
+    # Create the transcripts directory if it doesn't exist
+    # This is where we'll store the full cleaned transcripts
+    transcripts_dir = Path("transcripts")
+    transcripts_dir.mkdir(exist_ok=True)
+    
+    # Define the file path using the video ID as the filename
+    # Example: transcripts/dQw4w9WgXcQ.txt
+    file_path = transcripts_dir / f"{video_id}.txt"
+    
+    # Write the cleaned transcript to the file
+    # 'w' mode creates a new file or overwrites existing one
+    # encoding='utf-8' ensures proper character encoding
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(cleaned_transcript)
+
+
+def _chunk_transcript(video_id: str, cleaned_transcript: str, transcript_segments: List[Dict],
+                      video_title: str) -> List[Dict]:
+    """
+    Chunk the cleaned transcript with parameters chosen from its length.
+    """
+    # Calculate word count to optimize chunking parameters
+    word_count = len(cleaned_transcript.split())
+    
+    # Determine optimal TextTiling parameters based on length
+    # Short: < 1000 words (~7 mins) -> w=15
+    # Medium: 1000-4000 words -> w=20 (Default)
+    # Long: > 4000 words (~30 mins) -> w=30
+    if word_count < 1000:
+        w, k = 15, 10
+        print(f"🔹 Short video detected ({word_count} words). Using w=15 for finer granularity.")
+    elif word_count > 4000:
+        w, k = 30, 15
+        print(f"🔹 Long video detected ({word_count} words). Using w=30 for broader topics.")
+    else:
+        w, k = 20, 10
+        print(f"🔹 Medium video detected ({word_count} words). Using default w=20.")
+
+    # Create semantic chunks with optimized parameters
+    # Imported here: NLTK, SciPy and scikit-learn are only needed once a video is ingested
+    from Chunking.Textchunk import SemanticChunker
+    chunker = SemanticChunker(w=w, k=k)
+    
+    # Get chunks with metadata, timestamps, and overlapping for better RAG performance
+    # use_overlap=True enables sliding window (25 word overlap between chunks)
+    # This improves context retrieval for Q&A systems
+    return chunker.chunk_with_metadata(
+        cleaned_transcript, 
+        video_id=video_id,
+        transcript_segments=transcript_segments,  # NEW: Pass timestamp data
+        video_title=video_title,  # Shown in citations
+        use_overlap=True,  # Enable overlapping chunks for RAG
+        overlap_words=25   # 25 word overlap between consecutive chunks
+    )
+
+
+def _save_chunks(video_id: str, chunks_with_metadata: List[Dict]):
+    """
+    Write the chunks and the chunk metadata under chunks/<video_id>/.
+    """
+    # Create a directory for this video's chunks
+    # Example: chunks/dQw4w9WgXcQ/
+    chunks_dir = Path("chunks") / video_id
+    chunks_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Store every chunk in one JSON Lines file, one chunk per line
+    # A single open/write/close instead of one file per chunk
+    # Example: chunks/dQw4w9WgXcQ/chunks.jsonl
+    chunks_file = chunks_dir / "chunks.jsonl"
+    with open(chunks_file, 'wb') as f:
+        f.writelines(
+            orjson.dumps(chunk_data) + b"\n"
+            for chunk_data in chunks_with_metadata
+        )
+    
+    # Save chunk metadata as JSON
+    # This includes chunk_id, word_count, char_count for each chunk
+    # Example: chunks/dQw4w9WgXcQ/metadata.json
+    metadata_file = chunks_dir / "metadata.json"
+    # orjson writes UTF-8 bytes directly (non-ASCII text is kept as-is)
+    with open(metadata_file, 'wb') as f:
+        f.write(orjson.dumps(chunks_with_metadata, option=orjson.OPT_INDENT_2))
+
+
+def _index_chunks(video_id: str, chunks_with_metadata: List[Dict]):
+    """
+    Replace the video's chunks in the vector database.
+    """
+    # Shared vector store
+    vector_store = get_vector_store()
+    
+    # Delete any existing chunks for this video to avoid duplicates
+    vector_store.delete_video_chunks(video_id)
+    
+    # Add the new chunks to the vector database
+    # This automatically converts text to embeddings and stores them
+    vector_store.add_chunks(chunks_with_metadata)
+
+
 # POST endpoint - Fetch and store a transcript from YouTube URL
-@app.post("/transcript")
+@app.post("/transcript", response_model=TranscriptResponse)
 async def post_transcript(request: VideoRequest):
     """
     Fetch a transcript from a YouTube URL, clean it, chunk it, and store everything.
@@ -239,7 +387,14 @@ async def post_transcript(request: VideoRequest):
             )
         
         # Fetch the transcript WITH timestamps using the new method
-        transcript_data = fetcher.get_transcript_with_timestamps(request.url)
+        # The title lookup (oEmbed) runs at the same time, so it adds no wait
+        transcript_data, video_title = await asyncio.gather(
+            asyncio.to_thread(fetcher.get_transcript_with_timestamps, request.url),
+            asyncio.to_thread(fetcher.get_video_title, video_id)
+        )
+        
+        # Fall back to a placeholder when YouTube does not return a title
+        video_title = video_title or f"Video {video_id}"
         
         # Check if transcript was successfully fetched
         if not transcript_data:
@@ -257,95 +412,38 @@ async def post_transcript(request: VideoRequest):
         # Clean the transcript using the TranscriptCleaner
         # This removes filler words, extra spaces, repeated words, etc.
         cleaner = TranscriptCleaner()
-        cleaned_transcript = cleaner.clean_transcript(raw_transcript)
-        
-        # Create the transcripts directory if it doesn't exist
-        # This is where we'll store the full cleaned transcripts
-        transcripts_dir = Path("transcripts")
-        transcripts_dir.mkdir(exist_ok=True)
+        cleaned_transcript = await asyncio.to_thread(cleaner.clean_transcript, raw_transcript)
         
-        # Define the file path using the video ID as the filename
-        # Example: transcripts/dQw4w9WgXcQ.txt
-        file_path = transcripts_dir / f"{video_id}.txt"
-        
-        # Write the cleaned transcript to the file
-        # 'w' mode creates a new file or overwrites existing one
-        # encoding='utf-8' ensures proper character encoding
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(cleaned_transcript)
+        # Independent stages run side by side in worker threads:
+        # disk writes overlap with chunking and with embedding, so ingest takes
+        # about as long as the slowest stage rather than the sum of all of them
         
         # ===== CHUNKING SECTION =====
-        # Calculate word count to optimize chunking parameters
-        word_count = len(cleaned_transcript.split())
-        
-        # Determine optimal TextTiling parameters based on length
-        # Short: < 1000 words (~7 mins) -> w=15
-        # Medium: 1000-4000 words -> w=20 (Default)
-        # Long: > 4000 words (~30 mins) -> w=30
-        if word_count < 1000:
-            w, k = 15, 10
-            print(f"🔹 Short video detected ({word_count} words). Using w=15 for finer granularity.")
-        elif word_count > 4000:
-            w, k = 30, 15
-            print(f"🔹 Long video detected ({word_count} words). Using w=30 for broader topics.")
-        else:
-            w, k = 20, 10
-            print(f"🔹 Medium video detected ({word_count} words). Using default w=20.")
-
-        # Create semantic chunks with optimized parameters
-        chunker = SemanticChunker(w=w, k=k)
-        
-        # Get chunks with metadata, timestamps, and overlapping for better RAG performance
-        # use_overlap=True enables sliding window (25 word overlap between chunks)
-        # This improves context retrieval for Q&A systems
-        chunks_with_metadata = chunker.chunk_with_metadata(
-            cleaned_transcript, 
-            video_id=video_id,
-            transcript_segments=transcript_segments,  # NEW: Pass timestamp data
-            video_title=f"Video {video_id}",  # TODO: Extract actual title from YouTube API
-            use_overlap=True,  # Enable overlapping chunks for RAG
-            overlap_words=25   # 25 word overlap between consecutive chunks
+        # Save the full cleaned transcript to disk while it is being chunked
+        _, chunks_with_metadata = await asyncio.gather(
+            asyncio.to_thread(_save_transcript, video_id, cleaned_transcript),
+            asyncio.to_thread(_chunk_transcript, video_id, cleaned_transcript, transcript_segments, video_title)
         )
-
-        
-        # Create a directory for this video's chunks
-        # Example: chunks/dQw4w9WgXcQ/
-        chunks_dir = Path("chunks") / video_id
-        chunks_dir.mkdir(parents=True, exist_ok=True)
         
-        # Store each chunk as a separate file
-        for chunk_data in chunks_with_metadata:
-            chunk_id = chunk_data['chunk_id']
-            
-            # Save the chunk text
-            # Example: chunks/dQw4w9WgXcQ/chunk_0.txt
-            chunk_file = chunks_dir / f"chunk_{chunk_id}.txt"
-            with open(chunk_file, 'w', encoding='utf-8') as f:
-                f.write(chunk_data['text'])
-        
-        # Save chunk metadata as JSON
-        # This includes chunk_id, word_count, char_count for each chunk
-        # Example: chunks/dQw4w9WgXcQ/metadata.json
-        metadata_file = chunks_dir / "metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(chunks_with_metadata, f, indent=2, ensure_ascii=False)
-            
         # ===== VECTOR STORAGE SECTION =====
-        # Initialize the vector store
-        vector_store = VectorStore()
-        
-        # Delete any existing chunks for this video to avoid duplicates
-        vector_store.delete_video_chunks(video_id)
+        # Save the chunks and their metadata to disk while they are embedded and
+        # stored (replacing any previous ones for this video)
+        await asyncio.gather(
+            asyncio.to_thread(_save_chunks, video_id, chunks_with_metadata),
+            asyncio.to_thread(_index_chunks, video_id, chunks_with_metadata)
+        )
         
-        # Add the new chunks to the vector database
-        # This automatically converts text to embeddings and stores them
-        vector_store.add_chunks(chunks_with_metadata)
+        # Cached answers may describe the old transcript
+        answer_cache.invalidate(video_id)
         
         # Store the transcript data with timestamps in memory (for quick access)
+        # Counts are computed once here so /videos does not re-split every transcript
         transcript_storage[video_id] = {
             "text": cleaned_transcript,
             "segments": transcript_segments,
-            "title": f"Video {video_id}"  # TODO: Extract actual title
+            "title": video_title,
+            "word_count": len(cleaned_transcript.split()),
+            "segment_count": len(transcript_segments)
         }
 
         
@@ -365,7 +463,7 @@ async def post_transcript(request: VideoRequest):
 
 
 # POST endpoint - Ask a question about a video
-@app.post("/ask")
+@app.post("/ask", response_model=AnswerResponse)
 async def ask_question(request: QuestionRequest):
     """
     Answer a user's question about a video using RAG (Retrieval Augmented Generation).
@@ -377,15 +475,29 @@ async def ask_question(request: QuestionRequest):
         AnswerResponse with the generated answer and context used
     """
     try:
-        # 1. Initialize Vector Store
-        vector_store = VectorStore()
+        # 1. Shared Vector Store
+        vector_store = get_vector_store()
         
-        # 2. Search for relevant chunks
-        # This converts the question to an embedding and finds similar chunks
-        relevant_chunks = vector_store.search(
+        # 2. Embed the question once; used for the answer cache and the search
+        query_embedding = await asyncio.to_thread(vector_store.embed_query, request.question)
+        
+        # A first-turn question close to one already answered reuses that answer
+        # (follow-ups depend on the conversation, so they always go to Gemini)
+        cache_scope = (request.video_id, request.n_results)
+        use_cache = not request.chat_history
+        if use_cache:
+            cached = answer_cache.lookup(cache_scope, query_embedding)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+        
+        # 3. Search for relevant chunks
+        # This finds the chunks most similar to the question embedding
+        relevant_chunks = await asyncio.to_thread(
+            vector_store.search,
             query=request.question,
             n_results=request.n_results,
-            video_id=request.video_id
+            video_id=request.video_id,
+            query_embedding=query_embedding
         )
         
         if not relevant_chunks:
@@ -394,17 +506,25 @@ async def ask_question(request: QuestionRequest):
                 error="No relevant information found in the transcripts."
             )
             
-        # 3. Generate Answer using Gemini
+        # 4. Generate Answer using Gemini
         try:
-            agent = GeminiAgent()
-            answer = agent.generate_answer(request.question, relevant_chunks, request.chat_history)
+            agent = get_gemini_agent()
+            answer = await asyncio.to_thread(
+                agent.generate_answer, request.question, relevant_chunks, request.chat_history
+            )
             
-            return AnswerResponse(
+            response = AnswerResponse(
                 success=True,
                 answer=answer,
                 context=relevant_chunks
             )
             
+            # Remember real answers only, not generation errors
+            if use_cache and not answer.startswith("Error generating answer"):
+                answer_cache.store(cache_scope, query_embedding, response.model_copy(deep=True))
+            
+            return response
+            
         except ValueError as ve:
             # Handle missing API key
             return AnswerResponse(
@@ -419,6 +539,98 @@ async def ask_question(request: QuestionRequest):
         )
 
 
+def _sse(data: Dict, event: Optional[str] = None) -> bytes:
+    """
+    Format one Server-Sent Events frame with a JSON payload.
+    """
+    frame = b"data: " + orjson.dumps(data) + b"\n\n"
+    if event:
+        frame = b"event: " + event.encode() + b"\n" + frame
+    return frame
+
+
+# POST endpoint - Ask a question and stream the answer as it is generated
+@app.post("/ask/stream")
+async def ask_question_stream(request: QuestionRequest):
+    """
+    Same as /ask, but streams the answer as Server-Sent Events.
+    
+    Args:
+        request: QuestionRequest containing the question and optional video_id
+    
+    Returns:
+        text/event-stream with frames:
+        - data: {"delta": "..."}  one per piece of the answer, in order
+        - event: citations / data: {"context": [...]}  the chunks used, after the answer
+        - event: error / data: {"error": "..."}  on failure, instead of the citations frame
+          (deltas already sent before a generation error are not part of an answer)
+    """
+    async def events():
+        try:
+            # 1. Shared Vector Store
+            vector_store = get_vector_store()
+            
+            # 2. Embed the question once; used for the answer cache and the search
+            query_embedding = await asyncio.to_thread(vector_store.embed_query, request.question)
+            
+            # A cached answer is sent whole, as a single delta
+            cache_scope = (request.video_id, request.n_results)
+            use_cache = not request.chat_history
+            if use_cache:
+                cached = answer_cache.lookup(cache_scope, query_embedding)
+                if cached is not None:
+                    yield _sse({"delta": cached.answer})
+                    yield _sse({"context": cached.context}, event="citations")
+                    return
+            
+            # 3. Search for relevant chunks
+            relevant_chunks = await asyncio.to_thread(
+                vector_store.search,
+                query=request.question,
+                n_results=request.n_results,
+                video_id=request.video_id,
+                query_embedding=query_embedding
+            )
+            
+            if not relevant_chunks:
+                yield _sse({"error": "No relevant information found in the transcripts."}, event="error")
+                return
+            
+            # 4. Stream the answer from Gemini; each piece is forwarded as soon as it arrives
+            agent = get_gemini_agent()
+            # Already loaded by get_gemini_agent, so this import is free
+            from LLM.gemini_agent import GenerationError
+            pieces = []
+            try:
+                async for piece in iterate_in_threadpool(
+                    agent.generate_answer_stream(request.question, relevant_chunks, request.chat_history)
+                ):
+                    pieces.append(piece)
+                    yield _sse({"delta": piece})
+            except GenerationError as ge:
+                # No citations and no caching for a failed answer
+                yield _sse({"error": str(ge)}, event="error")
+                return
+            
+            yield _sse({"context": relevant_chunks}, event="citations")
+            
+            # Remember the completed answer
+            if use_cache and pieces:
+                answer_cache.store(
+                    cache_scope, query_embedding,
+                    AnswerResponse(success=True, answer="".join(pieces), context=relevant_chunks)
+                )
+        
+        except ValueError as ve:
+            # Handle missing API key
+            yield _sse({"error": f"Configuration Error: {str(ve)}. Please check your .env file."}, event="error")
+        except Exception as e:
+            yield _sse({"error": f"An error occurred: {str(e)}"}, event="error")
+    
+    # no-cache keeps proxies from buffering the stream
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 # GET endpoint - List all processed videos
 @app.get("/videos")
 async def list_videos():
@@ -433,8 +645,8 @@ async def list_videos():
         videos.append({
             "video_id": video_id,
             "title": data.get("title", f"Video {video_id}"),
-            "word_count": len(data.get("text", "").split()),
-            "has_segments": len(data.get("segments", [])) > 0
+            "word_count": data["word_count"],
+            "has_segments": data["segment_count"] > 0
         })
     
     return {
@@ -445,7 +657,7 @@ async def list_videos():
 
 
 # GET endpoint - Retrieve a stored transcript by video ID
-@app.get("/transcript/{video_id}")
+@app.get("/transcript/{video_id}", response_model=TranscriptResponse)
 async def get_transcript(video_id: str):
     """
     Retrieve a previously fetched transcript by video ID.
@@ -3,7 +3,32 @@
 import re
 
 # Import typing utilities for type hints
-from typing import List, Set
+from typing import List, FrozenSet
+
+
+# Patterns compiled once at import instead of being looked up on every call
+# \s+ matches one or more whitespace characters
+_RE_SPACES = re.compile(r'\s+')
+
+# Brackets and parentheses with their contents, e.g. "[Music]" or "(background noise)"
+_RE_BRACKETS = re.compile(r'\[.*?\]')
+_RE_PARENS = re.compile(r'\([^)]*\)')
+
+# Runs of sentence punctuation, e.g. "!!!"
+_RE_MULTI_PUNCT = re.compile(r'([.!?]){2,}')
+
+# A word followed by one or more repeats of itself, e.g. "the the the"
+_RE_REPEAT = re.compile(r'\b(\w+)(?:\s+\1\b)+', re.IGNORECASE)
+
+# Space before punctuation, and punctuation directly followed by a non-space
+_RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,!?;:])')
+_RE_MISSING_SPACE_AFTER_PUNCT = re.compile(r'(?<=[.,!?;:])(?=[^\s])')
+
+# Sentence-ending punctuation + space + lowercase letter
+_RE_SENTENCE_START = re.compile(r'[.!?]\s+[a-z]')
+
+# Punctuation ignored at either end of a word when matching filler words
+_FILLER_PUNCT = '.,!?;:'
 
 
 class TranscriptCleaner:
@@ -14,12 +39,13 @@ class TranscriptCleaner:
     
     # Define a set of common filler words and sounds to remove
     # These are words that don't add meaning to the transcript
-    FILLER_WORDS: Set[str] = {
+    # A frozenset: hashed once, and it cannot be changed by accident at runtime
+    FILLER_WORDS: FrozenSet[str] = frozenset({
         'uh', 'um', 'uhm', 'hmm', 'hm', 'ah', 'eh', 'er', 'like',
         'you know', 'i mean', 'sort of', 'kind of', 'basically',
         'actually', 'literally', 'right', 'okay', 'ok', 'yeah', 'yep',
         'nah', 'mhm', 'uh-huh', 'mm-hmm'
-    }
+    })
     
     @staticmethod
     def remove_extra_spaces(text: str) -> str:
@@ -33,8 +59,7 @@ class TranscriptCleaner:
             str: Text with normalized spacing
         """
         # Replace multiple spaces with a single space
-        # \s+ matches one or more whitespace characters
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_SPACES.sub(' ', text)
         
         # Remove leading and trailing whitespace
         text = text.strip()
@@ -60,9 +85,11 @@ class TranscriptCleaner:
         
         # Filter out filler words
         # Keep only words that are not in the FILLER_WORDS set
+        # The set is bound to a local once so the loop skips the class lookup per word
+        filler_words = TranscriptCleaner.FILLER_WORDS
         cleaned_words = [
             word for word in words 
-            if word.strip('.,!?;:') not in TranscriptCleaner.FILLER_WORDS
+            if word.strip(_FILLER_PUNCT) not in filler_words
         ]
         
         # Join the cleaned words back into a string
@@ -82,21 +109,12 @@ class TranscriptCleaner:
         Returns:
             str: Text with consecutive repeated words removed
         """
-        # Regular expression pattern to match repeated words
-        # \b(\w+)\s+\1\b matches a word followed by the same word
-        # \b = word boundary
-        # (\w+) = capture group for one or more word characters
-        # \s+ = one or more whitespace characters
+        # _RE_REPEAT matches a word and every repeat that follows it
+        # \b(\w+)(?:\s+\1\b)+ = a word, then one or more (spaces + the same word)
         # \1 = backreference to the first capture group (the repeated word)
-        pattern = r'\b(\w+)\s+\1\b'
-        
-        # Keep replacing repeated words until no more are found
-        # This handles cases like "the the the cat" -> "the cat"
-        while re.search(pattern, text, re.IGNORECASE):
-            # Replace the repeated word with a single occurrence
-            text = re.sub(pattern, r'\1', text, flags=re.IGNORECASE)
-        
-        return text
+        # Replacing the whole run with the first occurrence handles cases like
+        # "the the the cat" -> "the cat" in one pass, with no rescans of the text
+        return _RE_REPEAT.sub(r'\1', text)
     
     @staticmethod
     def fix_broken_sentences(text: str) -> str:
@@ -115,12 +133,12 @@ class TranscriptCleaner:
         
         # Fix spacing around punctuation
         # Remove space before punctuation marks
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+        text = _RE_SPACE_BEFORE_PUNCT.sub(r'\1', text)
         
         # Add space after punctuation if missing
         # (?<=[.,!?;:]) = positive lookback for punctuation
         # (?=[^\s]) = positive lookahead for non-whitespace
-        text = re.sub(r'(?<=[.,!?;:])(?=[^\s])', ' ', text)
+        text = _RE_MISSING_SPACE_AFTER_PUNCT.sub(' ', text)
         
         # Capitalize first letter after sentence-ending punctuation
         # This makes the text more readable
@@ -131,7 +149,7 @@ class TranscriptCleaner:
             return matched[:-1] + matched[-1].upper()
         
         # Pattern: period/question mark/exclamation + space + lowercase letter
-        text = re.sub(r'[.!?]\s+[a-z]', capitalize_after_period, text)
+        text = _RE_SENTENCE_START.sub(capitalize_after_period, text)
         
         # Capitalize the first letter of the entire text
         if text:
@@ -152,15 +170,15 @@ class TranscriptCleaner:
         """
         # Remove brackets and their contents (often metadata)
         # Example: "[Music]" or "[Applause]"
-        text = re.sub(r'\[.*?\]', '', text)
+        text = _RE_BRACKETS.sub('', text)
         
         # Remove parentheses and their contents if they contain non-word characters
         # Example: "(background noise)"
-        text = re.sub(r'\([^)]*\)', '', text)
+        text = _RE_PARENS.sub('', text)
         
         # Remove multiple punctuation marks
         # Example: "!!!" -> "!"
-        text = re.sub(r'([.!?]){2,}', r'\1', text)
+        text = _RE_MULTI_PUNCT.sub(r'\1', text)
         
         return text
     
@@ -192,8 +210,9 @@ class TranscriptCleaner:
         # Step 4: Fix broken sentences
         text = cls.fix_broken_sentences(text)
         
-        # Step 5: Remove extra spaces (final cleanup)
-        text = cls.remove_extra_spaces(text)
+        # No separate extra-space pass is needed: Step 2 rejoins the words with
+        # single spaces, and Steps 3-4 only remove words/spaces or add a single
+        # space before a non-space, so the text is already normalized here
         
         return text
 
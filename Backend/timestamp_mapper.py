@@ -5,7 +5,21 @@ Maps text chunks back to original video timestamps for citation attribution.
 Provides utilities for timestamp formatting and range calculation.
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Number of transcripts whose build_index result is kept in memory
+_INDEX_CACHE_SIZE = 32
+
+# id(transcript_segments) -> (transcript_segments, build_index result), least recently used first
+# The segments list itself is held so its id cannot be reused by another list while cached
+_index_cache: "OrderedDict[int, Tuple[List[Dict], Tuple]]" = OrderedDict()
+_index_cache_lock = threading.Lock()
 
 
 class TimestampMapper:
@@ -14,11 +28,77 @@ class TimestampMapper:
     Handles overlapping chunks and provides formatted timestamp ranges.
     """
     
+    @staticmethod
+    def build_index(transcript_segments: List[Dict]) -> Tuple[str, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Precompute what map_chunk_to_timestamps needs to locate chunks in a transcript.
+        
+        Args:
+            transcript_segments (List[Dict]): Original transcript with timestamps
+                Format: [{"text": "...", "start": 0.0, "duration": 2.5}, ...]
+                
+        Returns:
+            Tuple[str, np.ndarray, np.ndarray, np.ndarray]: (full_text, offsets, starts, ends)
+                - full_text: lowercased segment texts joined by spaces
+                - offsets: character offset where each segment starts in full_text,
+                  plus one final entry where the last segment (and its space) ends
+                - starts / ends: each segment's start and end time in seconds
+        
+        WHY AN INDEX?
+        Every chunk of a video is mapped against the same segments. Building the
+        joined text and the cumulative offsets once lets each chunk be placed with
+        two binary searches instead of a fresh join and a walk over every segment.
+        """
+        lowered = [seg['text'].lower() for seg in transcript_segments]
+        full_text = " ".join(lowered)
+        
+        # Each segment spans its text plus the joining space
+        offsets = np.zeros(len(lowered) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter((len(text) + 1 for text in lowered), dtype=np.int64, count=len(lowered)),
+                  out=offsets[1:])
+        
+        starts = np.fromiter((seg['start'] for seg in transcript_segments), dtype=np.float64,
+                             count=len(transcript_segments))
+        ends = starts + np.fromiter((seg['duration'] for seg in transcript_segments), dtype=np.float64,
+                                    count=len(transcript_segments))
+        return full_text, offsets, starts, ends
+    
+    @staticmethod
+    def get_index(transcript_segments: List[Dict]) -> Tuple[str, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        build_index(transcript_segments), memoized per segments list.
+        
+        Args:
+            transcript_segments (List[Dict]): Original transcript with timestamps
+            
+        Returns:
+            Tuple[str, np.ndarray, np.ndarray, np.ndarray]: Same as build_index
+        
+        Segment lists are treated as read-only once fetched; a list whose
+        length changed since it was indexed is indexed again.
+        """
+        key = id(transcript_segments)
+        with _index_cache_lock:
+            cached = _index_cache.get(key)
+            if cached is not None and cached[0] is transcript_segments and len(cached[1][2]) == len(transcript_segments):
+                _index_cache.move_to_end(key)
+                return cached[1]
+        
+        # Build outside the lock so other transcripts are not held up
+        index = TimestampMapper.build_index(transcript_segments)
+        with _index_cache_lock:
+            _index_cache[key] = (transcript_segments, index)
+            _index_cache.move_to_end(key)
+            if len(_index_cache) > _INDEX_CACHE_SIZE:
+                _index_cache.popitem(last=False)
+        return index
+    
     @staticmethod
     def map_chunk_to_timestamps(
         chunk_text: str,
         transcript_segments: List[Dict],
-        tolerance: int = 50
+        tolerance: int = 50,
+        index: Optional[Tuple[str, np.ndarray, np.ndarray, np.ndarray]] = None
     ) -> Tuple[float, float]:
         """
         Find the start and end timestamps for a chunk by matching it to transcript segments.
@@ -28,6 +108,8 @@ class TimestampMapper:
             transcript_segments (List[Dict]): Original transcript with timestamps
                 Format: [{"text": "...", "start": 0.0, "duration": 2.5}, ...]
             tolerance (int): Number of characters to use for fuzzy matching
+            index (Tuple): Optional build_index(transcript_segments) result;
+                when omitted, the memoized get_index(transcript_segments) is used
             
         Returns:
             Tuple[float, float]: (start_time, end_time) in seconds
@@ -35,57 +117,30 @@ class TimestampMapper:
         if not transcript_segments or not chunk_text:
             return (0.0, 0.0)
         
+        if index is None:
+            index = TimestampMapper.get_index(transcript_segments)
+        full_text, offsets, starts, ends = index
+        
         # Clean the chunk text for comparison
         chunk_clean = chunk_text.strip().lower()
         
-        # Try to find where this chunk starts in the transcript
-        start_time = None
-        end_time = None
-        
-        # Build a continuous text from segments to find the chunk position
-        full_text = " ".join([seg['text'] for seg in transcript_segments]).lower()
-        
         # Find the chunk in the full text
         chunk_start_pos = full_text.find(chunk_clean[:tolerance])
         
         if chunk_start_pos == -1:
             # If exact match not found, use first and last segments as fallback
-            start_time = transcript_segments[0]['start']
-            last_seg = transcript_segments[-1]
-            end_time = last_seg['start'] + last_seg['duration']
-            return (start_time, end_time)
-        
-        # Calculate character positions for each segment
-        current_pos = 0
-        for i, segment in enumerate(transcript_segments):
-            segment_text = segment['text'].lower()
-            segment_start_pos = current_pos
-            segment_end_pos = current_pos + len(segment_text) + 1  # +1 for space
-            
-            # Check if chunk starts in this segment
-            if start_time is None and segment_start_pos <= chunk_start_pos < segment_end_pos:
-                start_time = segment['start']
-            
-            # Check if chunk ends in this segment
-            chunk_end_pos = chunk_start_pos + len(chunk_clean)
-            if start_time is not None and segment_start_pos <= chunk_end_pos <= segment_end_pos:
-                end_time = segment['start'] + segment['duration']
-                break
-            
-            current_pos = segment_end_pos
+            return (float(starts[0]), float(ends[-1]))
         
-        # If we found start but not end, use the last segment
-        if start_time is not None and end_time is None:
-            last_seg = transcript_segments[-1]
-            end_time = last_seg['start'] + last_seg['duration']
+        # Segment whose span contains the chunk's first character
+        first = int(np.searchsorted(offsets, chunk_start_pos, side='right')) - 1
         
-        # Fallback if nothing found
-        if start_time is None:
-            start_time = transcript_segments[0]['start']
-            last_seg = transcript_segments[-1]
-            end_time = last_seg['start'] + last_seg['duration']
+        # First segment from there whose span reaches the chunk's end
+        # If the chunk runs past the last segment, use the last segment
+        chunk_end_pos = chunk_start_pos + len(chunk_clean)
+        last = max(int(np.searchsorted(offsets[1:], chunk_end_pos, side='left')), first)
+        last = min(last, len(ends) - 1)
         
-        return (start_time, end_time)
+        return (float(starts[first]), float(ends[last]))
     
     @staticmethod
     def format_timestamp(seconds: float) -> str:
@@ -116,6 +171,28 @@ class TimestampMapper:
         """
         return f"{TimestampMapper.format_timestamp(start)} – {TimestampMapper.format_timestamp(end)}"
     
+    @staticmethod
+    def format_ranges(starts: Sequence[float], ends: Sequence[float]) -> List[str]:
+        """
+        Format many timestamp ranges at once (same output as format_range).
+        
+        Args:
+            starts (Sequence[float]): Start times in seconds
+            ends (Sequence[float]): End times in seconds
+            
+        Returns:
+            List[str]: Formatted ranges (e.g., ["02:14 – 03:05", ...])
+        """
+        # Whole seconds -> (minutes, seconds) for every start and end in one vectorized step
+        seconds = np.asarray([starts, ends], dtype=np.float64).astype(np.int64)
+        minutes, secs = np.divmod(seconds, 60)
+        return [
+            f"{start_min:02d}:{start_sec:02d} – {end_min:02d}:{end_sec:02d}"
+            for start_min, start_sec, end_min, end_sec in zip(
+                minutes[0].tolist(), secs[0].tolist(), minutes[1].tolist(), secs[1].tolist()
+            )
+        ]
+    
     @staticmethod
     def get_chunk_timestamps(
         chunk_data: Dict,
@@ -0,0 +1,71 @@
+"""
+Transcript Store Module
+
+Keeps the most recently used processed transcripts in memory.
+Older transcripts are evicted once the store is full, so a long-running
+server no longer holds every transcript it has ever processed.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class TranscriptStore:
+    """
+    LRU-bounded mapping of video_id -> {"text": ..., "segments": [...], "title": ...}.
+
+    Supports the dict operations main.py uses (store[id], store[id] = ...,
+    id in store, items()). Reading or writing a transcript marks it as most
+    recently used; inserting past maxsize drops the least recently used one.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize an empty store.
+
+        Args:
+            maxsize (int): Maximum number of transcripts kept (default: 128)
+        """
+        self.maxsize = maxsize
+
+        # Least recently used first
+        self._data: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, video_id: str) -> Dict:
+        with self._lock:
+            value = self._data[video_id]
+            self._data.move_to_end(video_id)
+            return value
+
+    def __setitem__(self, video_id: str, value: Dict):
+        with self._lock:
+            self._data[video_id] = value
+            self._data.move_to_end(video_id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, video_id: str) -> bool:
+        with self._lock:
+            return video_id in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, video_id: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        """Return a transcript (marking it as recently used), or default if it is not stored."""
+        try:
+            return self[video_id]
+        except KeyError:
+            return default
+
+    def items(self) -> List[Tuple[str, Dict]]:
+        """
+        Snapshot of (video_id, transcript) pairs, least recently used first.
+
+        Listing does not change the eviction order.
+        """
+        with self._lock:
+            return list(self._data.items())
@@ -1,14 +1,411 @@
-# Import the YouTubeTranscriptApi class from the youtube_transcript_api library
-# This library allows us to fetch transcripts/captions from YouTube videos
-from youtube_transcript_api import YouTubeTranscriptApi
-
 # Import the re module for regular expression operations
 # We'll use this to extract video IDs from YouTube URLs
 import re
 
+# Use Google's RE2 engine for the video ID regex when it is installed (google-re2)
+# RE2 matches in linear time however the pattern grows, so URLs sent to the
+# public API can never trigger catastrophic backtracking; without it, fall back to re
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Import sys to intern video IDs, which are reused as cache keys
+import sys
+
+# Import string for the set of characters allowed in a video ID
+import string
+
+# Import functools to remember recently fetched transcripts
+import functools
+
+# Import os, sqlite3, threading, time and orjson to keep fetched transcripts on disk
+# across restarts and between server workers
+import os
+import sqlite3
+import threading
+import time
+import orjson
+
+# Import random to spread out retries of throttled fetches
+import random
+
+# Import logging to report fetch errors without formatting messages nobody reads
+import logging
+
+# Import asyncio to fetch many transcripts concurrently
+import asyncio
+
+# Import itemgetter/attrgetter to pull segment texts without a Python-level loop
+from operator import attrgetter, itemgetter
+
+# Import dataclass for the columnar Transcript form
+from dataclasses import dataclass
+
 # Import typing utilities for type hints
 # This improves code readability and helps with IDE autocomplete
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, NamedTuple, Sequence, Tuple, TextIO, TYPE_CHECKING
+
+# youtube_transcript_api, requests and numpy take most of this module's import time,
+# so they are imported on first use; URL parsing and formatting never load them.
+# These imports are for type hints only:
+# - youtube_transcript_api fetches transcripts/captions from YouTube videos
+# - requests looks up video titles and holds one pooled HTTP session for all fetches
+# - numpy stores the columnar Transcript form
+if TYPE_CHECKING:
+    import numpy as np
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+
+# YouTube's oEmbed endpoint returns a video's title without an API key
+OEMBED_URL = "https://www.youtube.com/oembed"
+
+# Regular expression matching YouTube video IDs, compiled once at import
+# This pattern handles multiple YouTube URL formats:
+# - youtube.com/watch?v=VIDEO_ID
+# - youtu.be/VIDEO_ID
+# - youtube.com/embed/VIDEO_ID
+# - youtube.com/v/VIDEO_ID
+# The compiled search is already faster than a str.find + slice + character check
+# fast path for watch?v= URLs, so there is no separate fast path. A hand-written
+# parser trying all four formats with `in`/index() was also about 1.5x slower on
+# typical URLs, and would accept watch?v= or /v/ on any host
+# Video IDs are ASCII by definition, so the re fallback is compiled with re.ASCII. Matching
+# encoded bytes instead of str was measured about 2x slower once the encode and
+# decode are counted, so URLs are searched as str
+_VIDEO_ID_PATTERN = r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})'
+_VIDEO_ID_RE = re2.compile(_VIDEO_ID_PATTERN) if re2 is not None else re.compile(_VIDEO_ID_PATTERN, re.ASCII)
+
+# Translation table deleting every character allowed in a video ID; an ID is
+# valid when nothing is left, checked in one C-level pass instead of a Python loop
+_ID_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+
+def _is_valid_video_id(video_id: str) -> bool:
+    """Check that video_id is 11 characters from [A-Za-z0-9_-], as YouTube IDs are."""
+    return len(video_id) == 11 and not video_id.translate(_ID_TABLE)
+
+
+# Keep-alive connections per host held by the shared session
+HTTP_POOL_SIZE = 32
+
+# (connect, read) timeouts in seconds for every request on the shared session, so a
+# stalled YouTube server cannot hold a worker thread indefinitely
+HTTP_TIMEOUT = (3.0, 10.0)
+
+# Upper bound on concurrent fetches in get_transcripts_batch
+MAX_BATCH_CONCURRENCY = 256
+
+# Module logger; the library's own INFO messages are kept out of the request path
+logger = logging.getLogger(__name__)
+logging.getLogger("youtube_transcript_api").setLevel(logging.WARNING)
+
+# Attempts per transcript fetch, and the first retry delay in seconds (doubled each retry)
+# This is the only retry layer; the HTTP session itself does not retry
+FETCH_ATTEMPTS = 3
+FETCH_BACKOFF = 0.5
+
+# No new attempt starts once this many seconds have passed since the first one,
+# so a fetch takes at most about FETCH_DEADLINE plus one attempt's HTTP timeouts
+FETCH_DEADLINE = 20.0
+
+# Directory of the on-disk transcript cache (an SQLite file), and how long entries stay valid
+# Defaults to a directory next to this module rather than a predictable path under /tmp
+TRANSCRIPT_CACHE_DIR = os.getenv(
+    "TRANSCRIPT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "transcript_cache")
+)
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Expired entries are deleted when the cache is opened and after every this many writes
+TRANSCRIPT_CACHE_PURGE_EVERY = 100
+
+# Serializes use of the shared SQLite connection between worker threads
+_disk_cache_lock = threading.Lock()
+_disk_cache_writes = 0
+
+
+class Segment(NamedTuple):
+    """
+    One transcript segment as the caches hold it.
+    
+    A named tuple takes about a third of the memory of the equivalent
+    {'text', 'start', 'duration'} dictionary and cannot be modified, so
+    cached transcripts are safe to share between callers.
+    """
+    text: str
+    start: float
+    duration: float
+
+
+@functools.lru_cache(maxsize=None)
+def _get_api() -> "YouTubeTranscriptApi":
+    """
+    Create the YouTubeTranscriptApi once and share it across fetches.
+    
+    Its requests.Session keeps connections to YouTube open, so repeat
+    fetches skip the TCP and TLS handshakes a fresh client would pay.
+    Every request on it times out after HTTP_TIMEOUT. It does not retry;
+    retries happen once, around the whole fetch, in _fetch_transcript.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from youtube_transcript_api import YouTubeTranscriptApi
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    # The library calls session.get/post without a timeout; supply a default
+    # (an explicit timeout= from a caller still takes precedence)
+    session.request = functools.partial(session.request, timeout=HTTP_TIMEOUT)
+    return YouTubeTranscriptApi(http_client=session)
+
+
+@functools.lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    """
+    Transient failures worth retrying: HTTP errors (e.g. 429, 5xx) and network errors.
+    
+    RequestBlocked (and its IpBlocked subclass) means YouTube is blocking this
+    IP, which does not clear within seconds, so it is raised at once.
+    """
+    import requests
+    from youtube_transcript_api import YouTubeRequestFailed
+    
+    return (YouTubeRequestFailed, requests.ConnectionError, requests.Timeout)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_disk_cache() -> sqlite3.Connection:
+    """
+    Open (and create if needed) the SQLite transcript cache once per process.
+    
+    WAL mode lets several server workers read the file while one of them writes.
+    The directory is created readable by this user only.
+    """
+    os.makedirs(TRANSCRIPT_CACHE_DIR, mode=0o700, exist_ok=True)
+    conn = sqlite3.connect(
+        os.path.join(TRANSCRIPT_CACHE_DIR, "transcripts.sqlite3"),
+        timeout=5.0,
+        check_same_thread=False,
+        isolation_level=None
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS transcripts "
+        "(key TEXT PRIMARY KEY, data BLOB NOT NULL, expires REAL NOT NULL)"
+    )
+    _purge_expired(conn)
+    return conn
+
+
+def _purge_expired(conn: sqlite3.Connection):
+    """Delete entries past their expiry so the file does not grow without bound."""
+    conn.execute("DELETE FROM transcripts WHERE expires <= ?", (time.time(),))
+
+
+def _disk_cache_get(key: str) -> Optional[Tuple[Segment, ...]]:
+    """
+    Read a transcript from the on-disk cache.
+    
+    Returns:
+        Optional[Tuple[Segment, ...]]: The segments, or None on a miss,
+                                       an expired entry, or any cache error
+    """
+    try:
+        with _disk_cache_lock:
+            row = _get_disk_cache().execute(
+                "SELECT data FROM transcripts WHERE key = ? AND expires > ?",
+                (key, time.time())
+            ).fetchone()
+    except Exception as e:
+        # A broken cache only costs a network fetch
+        logger.warning("Error reading transcript cache: %s", e)
+        return None
+    
+    if row is None:
+        return None
+    return tuple(map(Segment._make, orjson.loads(row[0])))
+
+
+def _disk_cache_set(key: str, transcript_data: Tuple[Segment, ...]):
+    """
+    Write a transcript to the on-disk cache, valid for TRANSCRIPT_CACHE_TTL seconds.
+    
+    Segments are stored as compact [text, start, duration] rows instead of
+    dictionaries, so the field names are not repeated for every segment.
+    """
+    # orjson does not serialize tuple subclasses, so each Segment becomes a plain tuple
+    data = orjson.dumps(list(map(tuple, transcript_data)))
+    global _disk_cache_writes
+    try:
+        with _disk_cache_lock:
+            conn = _get_disk_cache()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts (key, data, expires) VALUES (?, ?, ?)",
+                (key, data, time.time() + TRANSCRIPT_CACHE_TTL)
+            )
+            _disk_cache_writes += 1
+            if _disk_cache_writes % TRANSCRIPT_CACHE_PURGE_EVERY == 0:
+                _purge_expired(conn)
+    except Exception as e:
+        logger.warning("Error writing transcript cache: %s", e)
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_transcript(video_id: str, languages: tuple) -> Tuple[Segment, ...]:
+    """
+    Fetch a transcript from YouTube, remembering the 128 most recent ones.
+    
+    A video's transcript does not change, so repeat requests for the same
+    (video_id, languages) skip the network round-trip. Failures raise and
+    are not cached, so a later call tries YouTube again. Transient failures
+    (rate limiting, connection errors) are retried up to FETCH_ATTEMPTS times,
+    within FETCH_DEADLINE seconds, before raising.
+    
+    Below this in-memory layer sits the on-disk cache, which survives
+    restarts and is shared by every worker on the machine.
+    """
+    # Malformed IDs can never succeed; reject them before any cache or network work
+    if not _is_valid_video_id(video_id):
+        raise ValueError(f"Invalid YouTube video ID: {video_id!r}")
+    
+    # Check the on-disk cache before going to YouTube
+    cache_key = f"{video_id}:{','.join(languages)}"
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Shared YouTubeTranscriptApi (and connection pool)
+    ytt_api = _get_api()
+    retryable_errors = _retryable_errors()
+    
+    # Use the fetch method to get the transcript
+    # This returns a FetchedTranscript object
+    # Throttling and network errors are retried with exponential backoff plus jitter,
+    # so concurrent callers do not all hit YouTube again at the same moment
+    deadline = time.monotonic() + FETCH_DEADLINE
+    for attempt in range(FETCH_ATTEMPTS):
+        try:
+            fetched_transcript = ytt_api.fetch(video_id, languages=languages)
+            break
+        except retryable_errors:
+            delay = FETCH_BACKOFF * (2 ** attempt) + random.random() * 0.25
+            if attempt == FETCH_ATTEMPTS - 1 or time.monotonic() + delay >= deadline:
+                raise
+            time.sleep(delay)
+    
+    # Convert the FetchedTranscript snippets to Segments
+    # Read directly from each snippet rather than through to_raw_data(), whose
+    # dataclasses.asdict call deep-copies every field
+    # Stored as a tuple so the cached copy cannot be appended to or reordered
+    transcript_data = tuple(
+        Segment(snippet.text, snippet.start, snippet.duration)
+        for snippet in fetched_transcript
+    )
+    
+    # Remember it on disk for later processes
+    _disk_cache_set(cache_key, transcript_data)
+    return transcript_data
+
+
+@dataclass
+class Transcript:
+    """
+    A transcript stored column-wise: one list of texts and two parallel arrays of times.
+    
+    Segment i is (texts[i], starts[i], durations[i]). Compared with a list of
+    {'text', 'start', 'duration'} dictionaries, this drops the per-segment dict
+    and float objects, and lets time-range queries run as NumPy searches.
+    """
+    texts: List[str]
+    starts: "np.ndarray"
+    durations: "np.ndarray"
+    
+    @classmethod
+    def from_raw_data(cls, transcript_data: Sequence[Dict]) -> "Transcript":
+        """
+        Build a Transcript from raw segments in a single pass.
+        
+        Args:
+            transcript_data (Sequence[Dict]): Segments with 'text', 'start', and 'duration' keys
+        
+        Returns:
+            Transcript: The same segments as three parallel columns
+        """
+        import numpy as np
+        
+        texts, starts, durations = [], [], []
+        for segment in transcript_data:
+            texts.append(segment['text'])
+            starts.append(segment['start'])
+            durations.append(segment['duration'])
+        
+        # float64 keeps start/duration exactly as YouTube returned them
+        return cls(
+            texts=texts,
+            starts=np.asarray(starts, dtype=np.float64),
+            durations=np.asarray(durations, dtype=np.float64)
+        )
+    
+    @classmethod
+    def from_segments(cls, segments: Sequence[Segment]) -> "Transcript":
+        """
+        Build a Transcript from Segment tuples by transposing them.
+        
+        Args:
+            segments (Sequence[Segment]): Segments as returned by the fetch caches
+        
+        Returns:
+            Transcript: The same segments as three parallel columns
+        """
+        import numpy as np
+        
+        # zip(*rows) turns the rows into columns in C
+        texts, starts, durations = zip(*segments) if segments else ((), (), ())
+        return cls(
+            texts=list(texts),
+            starts=np.asarray(starts, dtype=np.float64),
+            durations=np.asarray(durations, dtype=np.float64)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def slice_by_time(self, start: float, end: float) -> "Transcript":
+        """
+        Get the segments that begin within [start, end) seconds.
+        
+        Args:
+            start (float): Range start in seconds (inclusive)
+            end (float): Range end in seconds (exclusive)
+        
+        Returns:
+            Transcript: The matching segments, in order
+        
+        Segment starts are sorted, so the range is found with two binary
+        searches instead of a scan over every segment.
+        """
+        lo, hi = self.starts.searchsorted((start, end), side='left')
+        return Transcript(
+            texts=self.texts[lo:hi],
+            starts=self.starts[lo:hi],
+            durations=self.durations[lo:hi]
+        )
+    
+    def to_raw_data(self) -> List[Dict]:
+        """
+        Convert back to the list of {'text', 'start', 'duration'} dictionaries get_transcript returns.
+        
+        Returns:
+            List[Dict]: One dictionary per segment
+        """
+        return [
+            {'text': text, 'start': start, 'duration': duration}
+            for text, start, duration in zip(self.texts, self.starts.tolist(), self.durations.tolist())
+        ]
 
 
 class YouTubeTranscriptFetcher:
@@ -28,57 +425,139 @@ class YouTubeTranscriptFetcher:
         Returns:
             Optional[str]: The extracted video ID if found, None otherwise
         """
-        # Define a regular expression pattern to match YouTube video IDs
-        # This pattern handles multiple YouTube URL formats:
-        # - youtube.com/watch?v=VIDEO_ID
-        # - youtu.be/VIDEO_ID
-        # - youtube.com/embed/VIDEO_ID
-        # - youtube.com/v/VIDEO_ID
-        pattern = r'(?:youtube\.com\/(?:watch\?v=|embed\/|v\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})'
-        
-        # Search for the pattern in the provided URL
-        match = re.search(pattern, url)
+        # Search for the precompiled video ID pattern in the provided URL
+        match = _VIDEO_ID_RE.search(url)
         
         # If a match is found, return the first captured group (the video ID)
         # Otherwise, return None
-        return match.group(1) if match else None
+        # Interned so every later cache lookup for this video shares one string object
+        return sys.intern(match.group(1)) if match else None
     
     @staticmethod
-    def get_transcript(video_id: str, languages: List[str] = ['en']) -> Optional[List[Dict]]:
+    def get_transcript(video_id: str, languages: Sequence[str] = ('en',)) -> Optional[List[Dict]]:
         """
         Fetch the transcript for a given YouTube video ID.
         
         Args:
             video_id (str): The YouTube video ID (11 characters)
-            languages (List[str]): List of preferred language codes (default: ['en'] for English)
+            languages (Sequence[str]): Preferred language codes (default: ('en',) for English)
         
         Returns:
             Optional[List[Dict]]: A list of transcript segments, each containing 'text', 'start', and 'duration'
                                   Returns None if transcript cannot be fetched
+        
+        Repeat calls for the same video and languages are served from memory.
+        The cache holds immutable Segment tuples; each call gets its own dictionaries.
         """
         try:
-            # Create an instance of YouTubeTranscriptApi
-            ytt_api = YouTubeTranscriptApi()
+            # Fetch (or reuse) the transcript; tuple() makes list arguments hashable for the cache key
+            # and returns the default ('en',) tuple itself without copying
+            segments = _fetch_transcript(video_id, tuple(languages))
             
-            # Use the fetch method to get the transcript
-            # This returns a FetchedTranscript object
-            fetched_transcript = ytt_api.fetch(video_id, languages=languages)
-            
-            # Convert the FetchedTranscript object to raw data (list of dictionaries)
-            # Each dictionary contains 'text', 'start', and 'duration' keys
-            transcript_data = fetched_transcript.to_raw_data()
+            # Unpack each Segment into the dictionary form callers expect
+            transcript_data = [
+                {'text': text, 'start': start, 'duration': duration}
+                for text, start, duration in segments
+            ]
             
             # Return the transcript data
             return transcript_data
             
         except Exception as e:
             # If any error occurs (video not found, no transcript available, etc.)
-            # Print the error message for debugging purposes
-            print(f"Error fetching transcript: {str(e)}")
+            # Log the error for debugging purposes (formatted only if warnings are enabled)
+            logger.warning("Error fetching transcript for %s: %s", video_id, e)
             
             # Return None to indicate failure
             return None
     
+    @staticmethod
+    def get_transcript_columns(video_id: str, languages: Sequence[str] = ('en',)) -> Optional[Transcript]:
+        """
+        Fetch the transcript for a video in the columnar Transcript form.
+        
+        Args:
+            video_id (str): The YouTube video ID (11 characters)
+            languages (Sequence[str]): Preferred language codes (default: ('en',) for English)
+        
+        Returns:
+            Optional[Transcript]: The transcript as parallel texts/starts/durations columns,
+                                  or None if it cannot be fetched
+        """
+        try:
+            # Convert straight from the memoized fetch, without an intermediate list copy
+            return Transcript.from_segments(_fetch_transcript(video_id, tuple(languages)))
+        except Exception as e:
+            logger.warning("Error fetching transcript for %s: %s", video_id, e)
+            return None
+    
+    @classmethod
+    async def get_transcripts_batch(cls, video_ids: List[str], languages: Sequence[str] = ('en',),
+                                    concurrency: int = 16) -> List[Optional[List[Dict]]]:
+        """
+        Fetch transcripts for many videos concurrently.
+        
+        Args:
+            video_ids (List[str]): YouTube video IDs (11 characters each)
+            languages (Sequence[str]): Preferred language codes (default: ('en',))
+            concurrency (int): Maximum fetches in flight at once (default: 16, capped at 256)
+        
+        Returns:
+            List[Optional[List[Dict]]]: One get_transcript result per video ID, in the
+                                        same order (None where a transcript could not be fetched)
+        
+        WHY CONCURRENT?
+        Each fetch mostly waits on YouTube. Running up to `concurrency` of them
+        in worker threads at once makes a batch take roughly
+        len(video_ids) / concurrency round-trips instead of len(video_ids).
+        
+        Repeated IDs are fetched once; every position asking for the same video
+        gets the same result.
+        """
+        semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_BATCH_CONCURRENCY)))
+        
+        async def fetch(video_id: str) -> Optional[List[Dict]]:
+            async with semaphore:
+                return await asyncio.to_thread(cls.get_transcript, video_id, languages)
+        
+        # Drop duplicates (keeping first-seen order) so concurrent copies of one
+        # video do not each miss the cache and go to YouTube
+        unique_ids = list(dict.fromkeys(video_ids))
+        fetched = await asyncio.gather(*(fetch(video_id) for video_id in unique_ids))
+        
+        # Map the results back onto the caller's order
+        results = dict(zip(unique_ids, fetched))
+        return [results[video_id] for video_id in video_ids]
+    
+    @staticmethod
+    def get_video_title(video_id: str, timeout: float = 5.0) -> Optional[str]:
+        """
+        Look up a video's title through YouTube's oEmbed endpoint.
+        
+        Args:
+            video_id (str): The YouTube video ID (11 characters)
+            timeout (float): Seconds to wait for YouTube before giving up (default: 5)
+        
+        Returns:
+            Optional[str]: The video title, or None if it could not be fetched
+        """
+        import requests
+        
+        try:
+            # One small JSON request: {"title": "...", "author_name": "...", ...}
+            response = requests.get(
+                OEMBED_URL,
+                params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json().get("title") or None
+            
+        except Exception as e:
+            # A missing title should never fail the ingest; callers fall back to a placeholder
+            logger.warning("Error fetching video title for %s: %s", video_id, e)
+            return None
+    
     @staticmethod
     def format_transcript(transcript_data: List[Dict]) -> str:
         """
@@ -97,52 +576,96 @@ class YouTubeTranscriptFetcher:
         
         # Extract the 'text' field from each transcript segment
         # Join all text segments with a space separator to create a continuous text
-        formatted_text = " ".join([segment['text'] for segment in transcript_data])
+        # map + itemgetter does the per-segment lookup in C
+        formatted_text = " ".join(map(itemgetter('text'), transcript_data))
         
         # Return the formatted transcript text
         return formatted_text
     
+    @staticmethod
+    def format_transcript_into(transcript_data: List[Dict], out: TextIO):
+        """
+        Write the same text as format_transcript to a stream, one segment at a time.
+        
+        Args:
+            transcript_data (List[Dict]): Raw transcript data from YouTube
+            out (TextIO): Where to write the text (e.g. an open file or io.StringIO)
+        
+        For very long transcripts written straight to a file or another
+        consumer, the full joined string never has to exist in memory.
+        """
+        write = out.write
+        texts = map(itemgetter('text'), transcript_data)
+        
+        # First segment as-is, then each following one preceded by a space
+        for text in texts:
+            write(text)
+            break
+        for text in texts:
+            write(" ")
+            write(text)
+    
     @classmethod
-    def get_transcript_from_url(cls, url: str, languages: List[str] = ['en']) -> Optional[str]:
+    def get_transcript_from_url(cls, url: str, languages: Sequence[str] = ('en',)) -> Optional[str]:
         """
         Convenience method to get a formatted transcript directly from a YouTube URL.
         
         Args:
             url (str): The YouTube video URL
-            languages (List[str]): List of preferred language codes (default: ['en'])
+            languages (Sequence[str]): Preferred language codes (default: ('en',))
         
         Returns:
             Optional[str]: The formatted transcript text, or None if unable to fetch
         """
+        # The text-only path; see get_text_from_url
+        return cls.get_text_from_url(url, languages)
+    
+    @classmethod
+    def get_text_from_url(cls, url: str, languages: Sequence[str] = ('en',)) -> Optional[str]:
+        """
+        Get only the transcript text for a YouTube URL.
+        
+        Args:
+            url (str): The YouTube video URL
+            languages (Sequence[str]): Preferred language codes (default: ('en',))
+        
+        Returns:
+            Optional[str]: The formatted transcript text, or None if unable to fetch
+        
+        Joins the texts straight from the memoized fetch instead of going through
+        get_transcript, so no per-call list of segments is built just to be discarded.
+        """
         # Step 1: Extract the video ID from the URL
         video_id = cls.extract_video_id(url)
         
         # If video ID extraction failed, return None
         if not video_id:
-            print("Invalid YouTube URL: Could not extract video ID")
+            logger.debug("Invalid YouTube URL: Could not extract video ID from %s", url)
             return None
         
-        # Step 2: Fetch the raw transcript data using the video ID
-        transcript_data = cls.get_transcript(video_id, languages)
+        # Step 2: Fetch (or reuse) the transcript segments
+        try:
+            transcript_data = _fetch_transcript(video_id, tuple(languages))
+        except Exception as e:
+            logger.warning("Error fetching transcript for %s: %s", video_id, e)
+            return None
         
-        # If transcript fetching failed, return None
+        # If the transcript is empty, return None
         if not transcript_data:
             return None
         
-        # Step 3: Format the transcript data into a readable string
-        formatted_transcript = cls.format_transcript(transcript_data)
-        
-        # Return the formatted transcript
-        return formatted_transcript
+        # Step 3: Join the segment texts into a readable string
+        # (the same text format_transcript builds, read from the Segment fields)
+        return " ".join(map(attrgetter('text'), transcript_data))
     
     @classmethod
-    def get_transcript_with_timestamps(cls, url: str, languages: List[str] = ['en']) -> Optional[Dict]:
+    def get_transcript_with_timestamps(cls, url: str, languages: Sequence[str] = ('en',)) -> Optional[Dict]:
         """
         Get transcript with timestamp data preserved for citation attribution.
         
         Args:
             url (str): The YouTube video URL
-            languages (List[str]): List of preferred language codes (default: ['en'])
+            languages (Sequence[str]): Preferred language codes (default: ('en',))
         
         Returns:
             Optional[Dict]: Dictionary containing:
@@ -156,7 +679,7 @@ class YouTubeTranscriptFetcher:
         
         # If video ID extraction failed, return None
         if not video_id:
-            print("Invalid YouTube URL: Could not extract video ID")
+            logger.debug("Invalid YouTube URL: Could not extract video ID from %s", url)
             return None
         
         # Step 2: Fetch the raw transcript data using the video ID